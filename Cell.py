@@ -11,6 +11,7 @@ import random
 from Slice import *
 from Scheds_Inter import *
 import json
+from utilities import timeToNextMultiple
 
 # Cell Class: cell description
 
@@ -35,14 +36,13 @@ class CellBase:
         self.frequency_range = fr
         self.tdd = tdd
         self.granularity = gr  # interSlice scheduler time granularity
+        self.slotClock = None
+        """Slot clock engine attached to the cell. If None, traffic and intra slice schedulers run as PEM methods"""
+        self.ingressClock = None
+        """Bearer ingress clock of the cell UEs, when they run as PEM methods (see UE.IngressClock)"""
     
-    def updateStsts(self,env,interv,tSim): # ---------- PEM -------------
-        """
-            This method manages the statistics collection. This is a PEM Method.
-            This method creates statistics files and stores counter values to calculate later the main kpi considered. \n
-            Inter Slice statistics are stored in the dlStsts_InterSlice.txt file for DL and ulStsts_InterSlice.txt file for UL. \n
-            Intra Slice statistics are stored in the dlStsts_<Slicename>Slice.txt file for DL and ulStsts_<Slicename>Slice.txt file for UL.
-        """
+    def openStsts(self):
+        """This method creates the statistics files and writes their headers."""
         if not os.path.exists('Statistics'):
             os.mkdir('Statistics')
         for slice in list(self.interSliceSched.slices.keys()):
@@ -57,8 +57,20 @@ class CellBase:
         self.slicesStsts['InterSlice']['UL'] = open('Statistics/ulStsts_InterSlice.txt','w')
         self.slicesStsts['InterSlice']['UL'].write('time Slice Connections ResourceUse sntPackets lstPackets rcvdBytes bufferSize'+'\n')
 
+    def updateStsts(self,env,interv,tSim): # ---------- PEM -------------
+        """
+            This method manages the statistics collection. This is a PEM Method.
+            This method creates statistics files and stores counter values to calculate later the main kpi considered. \n
+            Inter Slice statistics are stored in the dlStsts_InterSlice.txt file for DL and ulStsts_InterSlice.txt file for UL. \n
+            Intra Slice statistics are stored in the dlStsts_<Slicename>Slice.txt file for DL and ulStsts_<Slicename>Slice.txt file for UL.
+        """
+        if 'InterSlice' not in self.slicesStsts: # files are kept open when resumed from a checkpoint
+            self.openStsts()
+
         while env.now<(tSim*0.83):
-            yield env.timeout(interv)
+            yield env.timeout(timeToNextMultiple(env.now,interv))
+            for slice in list(self.interSliceSched.slices.keys()):
+                self.interSliceSched.slices[slice].closeIdleTTIs(env.now)
             for slice in list(self.interSliceSched.slices.keys()):
                 conn_UEs = list(self.interSliceSched.slices[slice].schedulerDL.ues.keys())
                 res = self.interSliceSched.slices[slice].schedulerDL.nrbUEmax
@@ -21,11 +21,7 @@ def printResults(dir,users,num_users,scheduler,t_sim,singleRunMode,fileSINR,sinr
     print (Format.CGREEN+'Accumulated '+dir+' indicators by user:'+Format.CEND)
     for i in range (num_users):
         # Count pending packets also as lost
-        users[i].packetFlows[0].lostPackets = users[i].packetFlows[0].lostPackets + len(list(scheduler.ues[users[i].id].pendingPckts.keys())) + len(users[i].packetFlows[0].appBuff.pckts) + len(scheduler.ues[users[i].id].bearers[0].buffer.pckts)
-        for p in list(scheduler.ues[users[i].id].pendingPckts.keys()):
-            for pp in scheduler.ues[users[i].id].bearers[0].buffer.pckts:
-                if p == pp.secNum:
-                     users[i].packetFlows[0].lostPackets = users[i].packetFlows[0].lostPackets - 1
+        users[i].packetFlows[0].lostPackets = users[i].packetFlows[0].lostPackets + scheduler.ues[users[i].id].segments.pendingPckts() + len(users[i].packetFlows[0].appBuff.pckts) + len(scheduler.ues[users[i].id].bearers[0].buffer.pckts)
 
         users[i].packetFlows[0].setMeassures(t_sim)
         PDRprom = PDRprom + users[i].packetFlows[0].meassuredKPI['PacketLossRate']
@@ -50,6 +46,31 @@ def printResults(dir,users,num_users,scheduler,t_sim,singleRunMode,fileSINR,sinr
     print ('Symbols in slot: '+'\t'+str(scheduler.TDDsmb))
     print ('Slice Numerology: '+'\t'+str(scheduler.ttiByms*15)+ ' kHz')
 
+def getAvKPIs(dir,users,num_users,scheduler,t_sim):
+    """
+        This method returns a dictionary with the main simulation results averaged by user.
+        Pending packets are counted as lost, as in printResults, but UE counters are not modified.
+    """
+    sent = 0
+    lost = 0
+    PDRprom = 0.0
+    THprom = 0.0
+    MCSprom = 0.0
+    for i in range (num_users):
+        flow = users[i].packetFlows[0]
+        ue = scheduler.ues[users[i].id]
+        lostUE = flow.lostPackets + ue.segments.pendingPckts() + len(flow.appBuff.pckts) + len(ue.bearers[0].buffer.pckts)
+        sent = sent + flow.sentPackets
+        lost = lost + lostUE
+        if flow.sentPackets > 0:
+            PDRprom = PDRprom + float(100*lostUE)/flow.sentPackets
+        if t_sim>1000:
+            THprom = THprom + (float(flow.rcvdBytes)*8000)/(0.83*t_sim*1024*1024)
+        MCSprom = MCSprom + float(users[i].MCS)
+    return {'dir':dir,'users':num_users,'sentPackets':sent,'lostPackets':lost,
+        'PLR':PDRprom/num_users,'Throughput':THprom/num_users,'MCS':MCSprom/num_users,
+        'PRBs':scheduler.nrbUEmax,'Numerology':scheduler.ttiByms*15}
+
 def getKPIs(dir,stFile,users,num_users,sinr_0,measInterv,tSim):
     """This method gets the intra slice kpi from the statistic files"""
     sent = {}
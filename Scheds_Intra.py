@@ -8,8 +8,13 @@ from operator import index
 from IntraSliceSch import IntraSliceScheduler, Format, TbQueueDeepMimo
 from collections import deque
 from utilities import Format
+from uestate import UeStateStore
+from channel import BER
+from debuglog import DEBUG, INFO
+from schedtrace import TB_QUEUED, TB_CODES
 from operator import attrgetter
 import numpy as np
+import bisect
 from itertools import combinations
 
 
@@ -20,13 +25,19 @@ SCS_TO_NUM = {
     '120khz': 8
 }
 
-BER = 0.01
 N_RE = 14
 THRESHOLD_ANGLE = 10
 DELTA = 0.7
 
 MIN_PRB_GROUP_TO_ASSIGN = 8
 
+MAX_SCHED_GROUP_SIZE = 8
+"""Maximum number of UEs in a NUM scheduler MU-MIMO group"""
+EXACT_GROUPS_MAX_UES = 10
+"""Maximum number of UEs with data for which the NUM scheduler enumerates all the valid groups"""
+SCHED_GROUPS_CACHE_SIZE = 64
+"""Maximum number of active UE sets whose scheduling groups the NUM scheduler keeps for the current scene"""
+
 
 class IntraSliceSchedulerDeepMimo(IntraSliceScheduler):
     def __init__(self, ba, n, debMd, sLod, ttiByms, mmd_, ly_, dir, Smb, robustMCS, slcLbl, sch, slice):
@@ -138,7 +149,8 @@ class IntraSliceSchedulerDeepMimo(IntraSliceScheduler):
             ue_has_prb_assigned = ue.prbs > 0
             ue_has_tb_to_retransmit = len(ue.pendingTB) > 0
 
-            self.printDebDataDM('---------------- '+ue_key+' ------------------<br>') # print more info in debbug mode
+            if self.dbMd: # print more info in debbug mode
+                self.printDeb(DEBUG,ue_key,'---------------- %s ------------------<br>',ue_key)
 
             if ue_has_prb_assigned and ue_has_packets_in_bearer:
 
@@ -155,33 +167,41 @@ class IntraSliceSchedulerDeepMimo(IntraSliceScheduler):
             This method sets the MCS and TBS for each TB over the specifics PRBs frequencies.
         """
         snr, _ = self.ues[u].radioLinks.get_radio_link_quality_over_assigned_prbs()
-        mcs_ = self.findMCS(snr)
-        if self.robustMCS and mcs_>2:
-            mcs_ = mcs_-2
-        mo = self.modTable[mcs_]['mod']
-        mcsi = self.modTable[mcs_]['mcsi']
-        Qm = self.modTable[mcs_]['bitsPerSymb']
-        R = self.modTable[mcs_]['codeRate']
+        mcs_ = self.mcsBySinr[self.findMCS(snr)]
+        mo, mcsi, Qm, R = self.amcRows[mcs_]
         # Find TBsize
-        if self.band == 'n257' or self.band == 'n258' or self.band == 'n260' or self.band == 'n261':
-            fr = 'FR2'
-        else:
-            fr = 'FR1'
         if nprb>0:
-            tbls = self.setTBS(R,Qm,self.direction,u,fr,nprb) # bits
+            tbls = self.setTBS(mcs_, u, nprb) # bits
         else:
             tbls = 0 # PF Scheduler
         return [tbls, mo, Qm, mcsi]
 
-    def setTBS(self, r, qm, uldl, ue, fr, nprb): # TS 38.214 procedure
-        OHtable = {'DL':{'FR1':0.14,'FR2':0.18},'UL':{'FR1':0.08,'FR2':0.10}}
-        OH = OHtable[uldl][fr]
-        Nre__ = min(156,math.floor(12*self.TDDsmb*(1-OH)))
-
-        tbs = Nre__*nprb*r*qm*self.ues[ue].assigned_layers
+    def setTBS(self, mcs, ue, nprb): # TS 38.214 procedure
+        tbs = self.tbsByPrb[mcs]*nprb*self.ues[ue].assigned_layers
 
         return tbs
 
+    def ttisToSignalling(self):
+        """
+            This method overrides the one in the parent class. DeepMIMO schedulers don't
+            insert RRC signalling TBs, so a drained slice only wakes up with new packets.
+        """
+        return None
+
+    def skipTTIs(self, n, count=True):
+        """
+            This method overrides the one in the parent class. In an idle TTI resAlloc
+            still moves the index of the first UE for PRB groups assignation. No idle TBs are built.
+        """
+        if n <= 0:
+            return None
+        self.sbFrNum = self.sbFrNum + n
+        cant_ues = len(list(self.ues.keys()))
+        if cant_ues > 0:
+            cant_prbs_groups = len(self.slice.assigned_base_prbs)//MIN_PRB_GROUP_TO_ASSIGN
+            self.assignation_start_index = (self.assignation_start_index + n*cant_prbs_groups) % cant_ues
+        return None
+
     def get_subcarrier_spacing(self):
         return self.slice.scs.lower()
 
@@ -206,6 +226,19 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         )
         self.ri = {}
         self.ri_mean = {}
+        self.maxGroupSize = MAX_SCHED_GROUP_SIZE
+        """Maximum number of UEs in a scheduling group"""
+        self.exactGroupsMaxUEs = EXACT_GROUPS_MAX_UES
+        """
+            Number of UEs with data up to which all the valid groups are enumerated and compared. With more UEs, the best
+            group of each PRB is searched on the angle compatibility graph with groupSearch method.
+        """
+        self.groupSearch = 'bnb'
+        """Group search method: 'bnb' (branch and bound, exact) or 'greedy'"""
+        self.groups_cache = {}
+        """Dictionary with the scheduling groups of the current scene, by active UE bitmask (see cached_sched_groups)"""
+        self.groups_cache_epoch = None
+        """Scene epoch of the groups in groups_cache"""
 
         self.plot_current_tti = 0
         self.plot_time_list = []
@@ -229,27 +262,42 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
 
             PRB_UE_list = list()
 
-            UE_sched_groups = self.set_sched_groups()
+            ue_list = self.get_ue_list()
+            exact = len(ue_list) <= self.exactGroupsMaxUEs
+            if exact:
+                UE_sched_groups, members, starts, ends = self.cached_sched_groups(ue_list)
+            else:
+                compatible = self.cached_sched_groups(ue_list)
             if schd=='NUM' and len(list(self.ues.keys()))>0:
-                for PRB in PRBs:
-                    sched_groups_numfactors = self.get_sched_groups_num_factors(UE_sched_groups, PRB)
-                    maxInd = np.argmax(sched_groups_numfactors)
+                throughput, layers = self.compute_UEs_throughput(ue_list, PRBs)
+                ri_factors = np.array([1/self.get_ri_mean_factor(ue.id) for ue in ue_list])
+                weights = throughput*ri_factors[:, None]
+                if exact:
+                    # NUM metric of each group (rows) in each PRB (columns): product of the sparse group membership matrix
+                    # (members and starts, in CSR form) with the UE metric matrix, adding members in group order
+                    winners = np.argmax(np.add.reduceat(weights[members], starts, axis=0), axis=0)
+                ue_prbs = [[] for ue in ue_list]
+                for p, PRB in enumerate(PRBs):
+                    if exact:
+                        best_group = members[starts[winners[p]]:ends[winners[p]]]
+                    else:
+                        best_group = self.search_sched_group(weights[:, p], compatible)
+                    group_layers = layers[best_group, p].min()
                     ue_name_csv = ''
-                    for ue in UE_sched_groups[maxInd]:
-                        ue.add_resources(
-                            base_prbs_list=PRB, layers = self.get_layers(UE_sched_groups[maxInd], PRB), cant_prbs = 1
+                    for i in best_group:
+                        ue_list[i].add_resources(
+                            base_prbs_list=PRB, layers = group_layers, cant_prbs = 1
                         )
-                        ue_name_csv += f"{ue.id},"
+                        ue_name_csv += f"{ue_list[i].id},"
+                        ue_prbs[i].append(p)
 
                     PRB_UE_list.append(ue_name_csv)
 
-                for ue in self.get_ue_list():
+                for i, ue in enumerate(ue_list):
                     ue_key = ue.id
                     ri_ue = 0
-                    ue_base_prbs = ue.assigned_base_prbs
-                    ue_prbs = self.convert_PRBs_base_to_PRBs(ue_base_prbs, scs)
-                    for PRB in ue_prbs:
-                        ri_ue = ri_ue + self.compute_UE_throughput(ue, PRB)
+                    for p in ue_prbs[i]:
+                        ri_ue = ri_ue + float(throughput[i, p])
 
                     self.ri[ue_key] = ri_ue
                     self.ri_mean[ue_key] = self.get_ri_mean_factor(ue_key)
@@ -260,9 +308,22 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         else:
             self.store_assigantion_data(PRBs, ['IDLE' for _ in PRBs])
 
+        if self.trace is not None:
+            self.traceResAlloc()
         # Print Resource Allocation
         #self.printResAlloc(UE_sched_groups, sched_groups_numfactors)
 
+    def skipTTIs(self, n, count=True):
+        """
+            This method overrides the one in the parent class. Skipped TTIs are stored as IDLE
+            in the resource grid.
+        """
+        idleTBs = super(NUM_Scheduler, self).skipTTIs(n, count)
+        PRBs = self.convert_PRBs_base_to_PRBs(self.get_assigned_PRBs(), self.get_subcarrier_spacing())
+        for _ in range(n):
+            self.store_assigantion_data(PRBs, ['IDLE' for _ in PRBs])
+        return idleTBs
+
     def store_assigantion_data(self, prb_list, ue_by_prb_list):
 
         if not ue_by_prb_list:
@@ -367,6 +428,40 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         for idue, ue in enumerate(self.ues.keys()):
             ue.sched_groups[0].group_number = idue//2
 
+    def cached_sched_groups(self, ue_list):
+        """
+            This method returns the scheduling groups of ue_list, the UEs with data: the list of valid groups (see set_sched_groups)
+            along with their membership matrix (see sched_groups_membership) if they are enumerated, or the compatibility
+            graph of the UEs otherwise (see exactGroupsMaxUEs).
+            Groups only depend on the UEs angles, which change with the scene, and on which UEs have data. So they are cached
+            by active UE bitmask, and the cache is cleared when the scene epoch (the sum of the UEs radio link epochs) changes.
+        """
+        epoch = sum(ue.radioLinks.epoch for ue in self.ues.values())
+        if epoch != self.groups_cache_epoch or len(self.groups_cache) >= SCHED_GROUPS_CACHE_SIZE:
+            self.groups_cache = {}
+            self.groups_cache_epoch = epoch
+        mask = 0
+        for ue in ue_list:
+            mask |= 1 << ue.idx
+        key = (mask, self.maxGroupSize, self.exactGroupsMaxUEs)
+        if key not in self.groups_cache:
+            if len(ue_list) <= self.exactGroupsMaxUEs:
+                self.groups_cache[key] = self.sched_groups_membership(self.set_sched_groups(), ue_list)
+            else:
+                self.groups_cache[key] = self.compatibility_graph(ue_list)
+        return self.groups_cache[key]
+
+    def sched_groups_membership(self, sched_groups, ue_list):
+        """
+            This method returns sched_groups along with their sparse membership matrix in CSR form: the flat array of the
+            positions in ue_list of the members of every group, and the start and end of each group in it.
+        """
+        position = {ue.id: i for i, ue in enumerate(ue_list)}
+        members = np.array([position[ue.id] for group in sched_groups for ue in group], dtype=np.intp)
+        ends = np.cumsum([len(group) for group in sched_groups])
+        starts = ends - np.array([len(group) for group in sched_groups])
+        return sched_groups, members, starts, ends
+
     def set_sched_groups(self):
         """This method divides the UEs in sched_groups taking into account the departure angle of the principal ray"""
         sched_groups = []
@@ -377,9 +472,9 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         return sched_groups
 
     def generate_all_possible_groups(self):
-        """This method returns all the possible groups that can be formed within the UEs of a slice"""
+        """This method returns all the possible groups of up to maxGroupSize UEs that can be formed within the UEs of a slice"""
         comb = []
-        for i in range(1, len(self.get_ue_list())+1):
+        for i in range(1, min(len(self.get_ue_list()), self.maxGroupSize)+1):
             comb += [list(j) for j in combinations(self.get_ue_list(), i)]
         return comb
 
@@ -397,6 +492,70 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
 
         return is_a_valid_group
 
+    def compatibility_graph(self, ue_list):
+        """
+            This method returns the angle compatibility graph of the UEs in ue_list, as a boolean adjacency matrix.
+            Two UEs are compatible, that is, they can be in the same group, if their principal ray angles differ more
+            than THRESHOLD_ANGLE (see valid_group), so groups are the cliques of the graph.
+        """
+        degrees = np.array([ue.radioLinks.degree[0] for ue in ue_list], dtype=float)
+        return np.abs(degrees[:, None] - degrees[None, :]) > THRESHOLD_ANGLE
+
+    def search_sched_group(self, weights, compatible):
+        """
+            This method returns the positions, in increasing order, of the UEs of the group with the biggest NUM metric for a PRB,
+            given the NUM metric of each UE (weights) in that PRB. It is searched on the compatibility graph with the groupSearch
+            method. The metric of a group is the sum of the metric of its UEs, so the best group is the maximum weight clique
+            of up to maxGroupSize UEs.
+        """
+        order = np.argsort(-weights, kind='stable')
+        if self.groupSearch == 'greedy':
+            members = self.greedy_group(weights[order], compatible[np.ix_(order, order)])
+        else:
+            members = self.bnb_group(weights[order], compatible[np.ix_(order, order)])
+        return sorted(order[members])
+
+    def greedy_group(self, weights, compatible):
+        """
+            This method returns the positions of a heavy clique of the compatibility graph. UEs are taken in weights order
+            (decreasing), and each one is added if it is compatible with the group and adds metric. It takes O(N*maxGroupSize).
+        """
+        members = [0]
+        allowed = compatible[0].copy()
+        for i in range(1, len(weights)):
+            if len(members) == self.maxGroupSize or weights[i] <= 0:
+                break
+            if allowed[i]:
+                members.append(i)
+                allowed &= compatible[i]
+        return members
+
+    def bnb_group(self, weights, compatible):
+        """
+            This method returns the positions of the maximum weight clique of up to maxGroupSize UEs of the compatibility graph,
+            with weights in decreasing order. It is a branch and bound search from the greedy group, where a branch is pruned
+            when its weight plus the biggest weights which fit in the group can not beat the best group found.
+            As groups are bounded in size, it takes O(N^maxGroupSize) steps at most, and much less in practice.
+        """
+        best = self.greedy_group(weights, compatible)
+        bestWeight = [weights[best].sum(), best]
+
+        def expand(members, weight, candidates):
+            if weight > bestWeight[0]:
+                bestWeight[0] = weight
+                bestWeight[1] = members
+            room = self.maxGroupSize - len(members)
+            if room == 0:
+                return
+            for k in range(len(candidates)):
+                if weight + weights[candidates[k:k+room]].sum() <= bestWeight[0]:
+                    return # Candidates are sorted by weight, so next bounds are not bigger
+                i = candidates[k]
+                rest = candidates[k+1:]
+                expand(members + [i], weight + weights[i], rest[compatible[i, rest]])
+
+        expand([], 0.0, np.arange(len(weights)))
+        return bestWeight[1]
 
     def get_sched_groups_num_factors(self, sched_groups, PRB):
         """This method sets the NUM metric for each UE_sched_group for a given PRB"""
@@ -424,7 +583,8 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         return self.ri_mean[ue_key]
 
     def get_ri(self, ue_key):
-        self.ri.setdefault(ue_key, 10*np.random.rand())
+        if ue_key not in self.ri: # Draw only for new UEs
+            self.ri[ue_key] = 10*np.random.rand()
         return self.ri[ue_key]
 
     def compute_UE_sched_groups_throughput(self, ue, sched_groups, PRB):
@@ -443,6 +603,41 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         throughput= layers*N_RE*math.log(1+B*snr, 2)
         return float(throughput)
 
+    def compute_UEs_throughput(self, ue_list, PRBs):
+        """
+            This method returns the throughput (ci, see compute_UE_throughput) and layers matrices of the UEs in ue_list
+            in each PRB of PRBs, with (UE, PRB) shape. PRBs is a list of base PRB lists, as returned by convert_PRBs_base_to_PRBs.
+        """
+        if len(PRBs) == 0:
+            return np.zeros((len(ue_list), 0)), np.zeros((len(ue_list), 0), dtype=int)
+        num = SCS_TO_NUM[self.get_subcarrier_spacing()]
+        base_prbs = np.concatenate(PRBs).astype(np.intp)
+        groups = self.prb_groups(base_prbs, num)
+        if groups is not None: # Values precomputed by scene in the radio links
+            capacity = np.array([ue.radioLinks.prb_capacity[num] for ue in ue_list])[:, groups]
+            layers = np.array([ue.radioLinks.prb_rank[num] for ue in ue_list])[:, groups]
+            return layers*N_RE*capacity, layers
+        B = -1.5/math.log(5*BER)
+        sizes = np.array([len(PRB) for PRB in PRBs])
+        starts = np.cumsum(sizes) - sizes
+        snr = np.array([ue.radioLinks.snr for ue in ue_list])[:, base_prbs]
+        rank = np.array([ue.radioLinks.rank for ue in ue_list])[:, base_prbs]
+        layers = np.minimum.reduceat(rank, starts, axis=1)
+        snr_mean = np.add.reduceat(snr, starts, axis=1)/sizes
+        return layers*N_RE*np.log2(1+B*snr_mean), layers
+
+    def prb_groups(self, base_prbs, num):
+        """
+            This method returns the PRB index, in the grid of num base PRBs by PRB, of each PRB made of num consecutive items of
+            base_prbs. It returns None if some of them is not a whole PRB of that grid, like it happens when base PRBs are not aligned.
+        """
+        if len(base_prbs) % num != 0:
+            return None
+        first = base_prbs[::num]
+        if np.any(first % num != 0) or np.any(base_prbs.reshape(-1, num) != first[:, None] + np.arange(num)):
+            return None
+        return first//num
+
     def get_layers(self, sched_group, PRB):
         """This method returns the amount of layers for a sched group in a PRB"""
         layers = min(sched_group[0].radioLinks.rank[PRB])
@@ -456,11 +651,9 @@ class NUM_Scheduler(IntraSliceSchedulerDeepMimo): # NUM Sched ---------
         if self.dbMd:
             self.printDebData('+++++++++++ Res Alloc +++++++++++++'+'<br>')
             self.printDebData('PRBs: '+str(self.nrbUEmax)+'<br>')
-            resAllocMsg = ''
             for sched_group in sched_groups:
                 for ue in sched_group:
-                    resAllocMsg = resAllocMsg + ue + sched_group + ' ' +str(self.ues[ue].prbs) + '<br>'
-            self.printDebData(resAllocMsg)
+                    self.printDeb(INFO,ue,'%s%s %s<br>',ue,sched_group,self.ues[ue].prbs)
             self.printDebData('+++++++++++++++++++++++++++++++++++'+'<br>')
 
 class PF_Scheduler(IntraSliceScheduler): # PF Sched ---------
@@ -471,6 +664,20 @@ class PF_Scheduler(IntraSliceScheduler): # PF Sched ---------
         IntraSliceScheduler.__init__(self,ba,n,debMd,sLod,ttiByms,mmd_,ly_,dir,Smb,robustMCS,slcLbl,sch)
         self.promLen = 30
         """Past Throughput average length considered in PF metric"""
+        self.stateStore = UeStateStore(self.promLen+1)
+        if self.schType[0:2] == 'PF':
+            self.expNum = float(self.schType[2])
+            """PF metric numerator exponent, from the PFxy scheduler type"""
+            self.expDen = float(self.schType[3])
+            """PF metric denominator exponent, from the PFxy scheduler type"""
+        self.sinrThresholdsArr = np.asarray(self.sinrThresholds)
+        self.mcsBySinrArr = np.asarray(self.mcsBySinr)
+        self.tbsByPrbArr = np.asarray(self.tbsByPrb)
+        """AMC tables as arrays, to find the TBS of all the UEs at once"""
+        self.pfNum = np.zeros(0)
+        """PF metric numerator (possible TBS) of each UE row in the last TTI"""
+        self.pfDen = np.zeros(0)
+        """PF metric denominator (past TBS average) of each UE row in the last TTI"""
 
     def resAlloc(self,band):
         """
@@ -481,67 +688,154 @@ class PF_Scheduler(IntraSliceScheduler): # PF Sched ---------
         """
         schd = self.schType[0:2]
         if schd=='PF' and len(list(self.ues.keys()))>0:
-            exp_num = float(self.schType[2])
-            exp_den = float(self.schType[3])
-            self.setUEfactor(exp_num, exp_den)
+            self.setUEfactor(self.expNum, self.expDen)
             maxInd = self.findMaxFactor()
-            for ue in list(self.ues.keys()):
-                if ue == maxInd:
-                    self.ues[ue].prbs = band
-                else:
-                    self.ues[ue].prbs = 0
-                    if len(self.ues[ue].pastTbsz)>self.promLen:
-                        self.ues[ue].pastTbsz.popleft()
-                    self.ues[ue].pastTbsz.append(self.ues[ue].tbsz)
-                    self.ues[ue].tbsz = 1
+            store = self.stateStore
+            maxRow = self.ues[maxInd].stateRow
+            prbs = store.column('prbs')
+            prbs[:] = 0
+            prbs[maxRow] = band
+            rows = np.arange(store.n)
+            rows = rows[rows != maxRow]
+            tbsz = store.column('tbsz')
+            store.pushPastTbsz(rows, tbsz[rows])
+            tbsz[rows] = 1
         # Print Resource Allocation
         self.printResAlloc()
 
+    def queueUpdate(self):
+        """
+            This method overrides the one in the parent class. PF resource allocation gives PRBs to a single UE, so out of
+            debug mode, instead of visiting one by one the UEs without PRBs, the UE index jumps to the next UE with PRBs.
+            UEs list follows the UE state store rows order, so the UE index is also the UE row.
+        """
+        packts = 1
+        store = self.stateStore
+        self.ueLst = [ue.id for ue in store.ues]
+        self.resAlloc(self.nrbUEmax)
+        prbs = store.column('prbs').tolist()
+        allocated = np.flatnonzero(store.column('prbs')).tolist()
+        rb = 0
+        if self.mimomd == 'MU':
+            self.rb_lim = self.nrbUEmax*self.nlayers # max allocated RB/TTI
+        else:
+            self.rb_lim = self.nrbUEmax
+
+        while len(self.ueLst)>0 and packts>0 and self.rb_lim > 0 and (rb + prbs[self.ind_u]) <= self.rb_lim:
+            ue = self.ueLst[self.ind_u]
+            if prbs[self.ind_u]==0 and not self.dbMd:
+                if len(allocated)==0:
+                    break
+                i = bisect.bisect_left(allocated,self.ind_u)
+                self.ind_u = allocated[i] if i<len(allocated) else allocated[0]
+                continue
+            if self.dbMd: # print more info in debbug mode
+                self.printDeb(DEBUG,ue,'---------------- %s ------------------<br>',ue)
+            if prbs[self.ind_u]>0:
+                if len(self.ues[ue].bearers)>0 and rb < self.rb_lim:
+                    if len(self.ues[ue].pendingTB)==0: # No TB to reTX
+                        rb = rb + self.rrcUncstSigIn(ue)
+                        if  rb < self.rb_lim:
+                            rb = rb + self.dataPtoTB(ue)
+                    else: # There are TB to reTX
+                        rb = rb + self.retransmitTB(ue)
+                    if self.dbMd:
+                        self.printQtb() # Print TB queue in debbug mode
+            self.updIndUE()
+
+            packts = self.updSumPcks()
+
+    def skipTTIs(self,n,count=True):
+        """
+            This method overrides the one in the parent class. In an idle TTI no UE has data, so resource allocation
+            falls back to the UE at the UE index, which gets all the PRBs and an empty data TB. Skipped TTIs are considered
+            in the UEs past TBS averages as TTIs without transmission, except for that UE, which takes its possible TBS.
+        """
+        ind_u = self.ind_u
+        visits = len(self.ueLst)>0 and self.idleTTIvisitsUE()
+        idleTBs = IntraSliceScheduler.skipTTIs(self,n,count)
+        store = self.stateStore
+        rows = np.arange(store.n)
+        tbsz = store.column('tbsz')
+        tbs = self.possibleTbs(self.nrbUEmax) if visits else None
+        start = max(0,n-self.promLen-1) # Older TTIs are out of the past TBS windows
+        for t in range(max(0,start-1),n): # TTI start-1 only sets the TBS pushed in TTI start
+            if t >= start:
+                store.pushPastTbsz(rows, tbsz)
+            tbsz[:] = 1
+            if visits:
+                row = (ind_u + t)%len(self.ueLst)
+                tbsz[row] = tbs[row]
+        return idleTBs
+
+    def countIdleTBs(self,tbs):
+        """This method overrides the one in the parent class, updating the UE state store columns at once."""
+        store = self.stateStore
+        store.column('resUse')[:len(tbs)] += tbs
+        store.column('TXedTB')[:len(tbs)] += tbs
+
+    def setIdleMods(self,tbs):
+        """This method overrides the one in the parent class. The UE with the empty data TB gets all the PRBs."""
+        for row in np.flatnonzero(tbs).tolist():
+            self.setIdleMod(self.ueLst[row],self.nrbUEmax)
+
+    def possibleTbs(self,nprb):
+        """
+            This method returns the TBS of each UE row for nprb PRBs, as setMod would find it with the UE current SINR,
+            looking up the AMC tables arrays for all the UEs at once.
+        """
+        store = self.stateStore
+        if nprb <= 0:
+            return np.zeros(store.n) # PF Scheduler
+        sinr = np.array([ue.radioLinks.linkQuality for ue in store.ues])
+        tbs = self.tbsByPrbArr[self.mcsBySinrArr[np.searchsorted(self.sinrThresholdsArr,sinr,side='right')]]*nprb
+        if self.mimomd == 'SU':
+            tbs = tbs*self.nlayers
+        return tbs
+
     def setUEfactor(self, exp_n, exp_d):
         """
-            This method sets the PF metric for each UE.
+            This method sets the PF metric for each UE, with the past TBS running averages of the UE state store.
         """
-        for ue in list(self.ues.keys()):
-            sumTBS = 0
-            for t in self.ues[ue].pastTbsz:
-                sumTBS = sumTBS + t
-            actual_den = sumTBS/len(self.ues[ue].pastTbsz)
-            [tbs, mod, bi, mcs] = self.setMod(ue,self.nrbUEmax)
-            self.ues[ue].pfFactor = math.pow(float(tbs), exp_n)/math.pow(actual_den,exp_d)
-            self.ues[ue].lastDen = actual_den
-            self.ues[ue].num = tbs
+        store = self.stateStore
+        self.pfNum = self.possibleTbs(self.nrbUEmax)
+        self.pfDen = store.pastMean()
+        store.column('pfFactor')[:] = self.pfNum**exp_n/self.pfDen**exp_d
 
     def findMaxFactor(self):
         """
-            This method finds and returns the UE with the highest metric
+            This method finds and returns the UE with the highest metric among the UEs with data in their bearer buffers.
+            If no UE with data has a positive metric, the next UE with data in round robin order is returned.
         """
-        factorMax = 0
-        factorMaxInd = ''
-        for ue in list(self.ues.keys()):
-            if len(self.ues[ue].bearers[0].buffer.pckts)>0 and self.ues[ue].pfFactor>factorMax:
-                factorMax = self.ues[ue].pfFactor
-                factorMaxInd = ue
-        if factorMaxInd=='':
+        store = self.stateStore
+        hasData = np.array([len(ue.bearers[0].buffer.pckts)>0 for ue in store.ues])
+        factors = np.where(hasData, store.column('pfFactor'), 0.0)
+        row = int(np.argmax(factors))
+        if factors[row] > 0:
+            return store.ues[row].id
+        ue = list(self.ues.keys())[self.ind_u]
+        q = 0
+        while len(self.ues[ue].bearers[0].buffer.pckts)==0 and q<len(self.ues):
+            self.updIndUE()
             ue = list(self.ues.keys())[self.ind_u]
-            q = 0
-            while len(self.ues[ue].bearers[0].buffer.pckts)==0 and q<len(self.ues):
-                self.updIndUE()
-                ue = list(self.ues.keys())[self.ind_u]
-                q = q + 1
-            factorMaxInd = ue
-
-        return factorMaxInd
+            q = q + 1
+        return ue
 
     def printResAlloc(self):
+        if self.trace is not None:
+            self.traceResAlloc()
         if self.dbMd:
             self.printDebData('+++++++++++ Res Alloc +++++++++++++'+'<br>')
             self.printDebData('PRBs: '+str(self.nrbUEmax)+'<br>')
-            resAllocMsg = ''
             for ue in list(self.ues.keys()):
-                resAllocMsg = resAllocMsg + ue +' '+ str(self.ues[ue].pfFactor)+' '+str(self.ues[ue].prbs)+ ' '+str(self.ues[ue].num)+' '+ str(self.ues[ue].lastDen)+'<br>'
-            self.printDebData(resAllocMsg)
+                row = self.ues[ue].stateRow
+                self.printDeb(INFO,ue,'%s %s %s %s %s<br>',ue,self.ues[ue].pfFactor,self.ues[ue].prbs,self.pfNum[row],self.pfDen[row])
             self.printDebData('+++++++++++++++++++++++++++++++++++'+'<br>')
 
+    def traceMetric(self,ue):
+        """This method returns the PF factor of ue, written in its ALLOC trace records."""
+        return ue.pfFactor
+
 class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
     """
         This class implements TDD intra slice scheduling.
@@ -594,7 +888,8 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
 
         while len(self.ueLst)>0 and packts>0 and sym < self.sm_lim:
             ue = self.ueLst[self.ind_u]
-            self.printDebDataDM('---------------- '+ue+' ------------------<br>') # print more info in debbug mode
+            if self.dbMd: # print more info in debbug mode
+                self.printDeb(DEBUG,ue,'---------------- %s ------------------<br>',ue)
             if self.ues[ue].symb>0:
                 if len(self.ues[ue].bearers)>0 and sym < self.sm_lim:
                     if len(self.ues[ue].pendingTB)==0: # No TB to reTX
@@ -609,6 +904,14 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
             self.updIndUE()
             packts = self.updSumPcks()
 
+    def idleTTIvisitsUE(self):
+        """This method overrides the one in the parent class. In an idle TTI the UE at the UE index is visited if the slice has PRBs."""
+        return self.nrbUEmax > 0
+
+    def idleTBsByUE(self,n):
+        """This method overrides the one in the parent class. TDD data TBs are only built for UEs with packets, so idle TTIs build no TBs."""
+        return np.zeros(len(self.ueLst),dtype=int)
+
     def rrcUncstSigIn(self,u):
         ueN = int(self.ues[u].id[2:])
         sfSig = int(float(1)/self.sLoad)
@@ -629,9 +932,14 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
             intd = self.queue.insertTB(pendingTbl)
             self.ues[u].pendingTB.pop(0)
             pendingTbl.reTxNum = pendingTbl.reTxNum + 1
+            if intd and self.trace is not None:
+                self.trace.record(TB_QUEUED,self.sbFrNum,pendingTbl.ue,pendingTbl.id,pendingTbl.size,pendingTbl.numRB,TB_CODES['reTx'])
+            if not intd:
+                self.tbPool.releaseTB(pendingTbl)
             r = self.symMax
         else:
             self.ues[u].pendingTB.pop(0) # Drop!!!
+            self.tbPool.releaseTB(pendingTbl)
             r = 0
         return r
 
@@ -652,7 +960,8 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
         self.ues[u].MCS = mcs__
         self.setBLER(u)
         tbSize = int(float(tbSbits)/8) # TB size in bytes
-        self.printDebDataDM('TBs: '+str(tbSize)+' nrb: '+str(n)+' FreeSp: '+str(self.queue.getFreeSpace())+'<br>')
+        if self.dbMd:
+            self.printDeb(DEBUG,u,'TBs: %s nrb: %s FreeSp: %s<br>',tbSize,n,self.queue.getFreeSpace())
         pks_s = 0
         list_p = []
         while pks_s<tbSize and len(self.ues[u].bearers[0].buffer.pckts)>0:
@@ -664,12 +973,15 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
         if (pks_s - tbSize)>0:
             pacD.size = pks_s - tbSize
             self.ues[u].bearers[0].buffer.insertPcktLeft(pacD)
+            self.ues[u].segments.setTail(pacD.secNum)
+        elif len(list_p)>0:
+            self.ues[u].segments.setTail(None)
         return self.ues[u].symb
 
-    def setTBS(self,r,qm,uldl,u_,fr,nprb): # TS 38.214 procedure
-        OHtable = {'DL':{'FR1':0.14,'FR2':0.18},'UL':{'FR1':0.08,'FR2':0.10}}
-        OH = OHtable[uldl][fr]
-        Nre__ = min(156,math.floor(12*self.ues[u_].symb*(1-OH)))
+    def setTBS(self,mcs,u_,nprb): # TS 38.214 procedure
+        # TDD scheduler allocates symbols by UE, so the resource elements by PRB depend on the UE
+        mo,mcsi,qm,r = self.amcRows[mcs]
+        Nre__ = min(156,math.floor(12*self.ues[u_].symb*(1-self.overhead)))
         if self.mimomd == 'SU':
             Ninfo = Nre__*nprb*r*qm*self.nlayers
             tbs = Ninfo
@@ -679,15 +991,19 @@ class TDD_Scheduler(IntraSliceScheduler): # TDD Sched ---------
         return tbs
 
     def printResAlloc(self):
+        if self.trace is not None:
+            self.traceResAlloc()
         if self.dbMd:
             self.printDebData('+++++++++++ Res Alloc +++++++++++++'+'<br>')
             self.printDebData('PRBs: '+str(self.nrbUEmax)+'<br>')
-            resAllocMsg = ''
             for ue in list(self.ues.keys()):
-                resAllocMsg = resAllocMsg + ue +': '+ str(self.ues[ue].symb)+' symbols'+'<br>'
-            self.printDebData(resAllocMsg)
+                self.printDeb(INFO,ue,'%s: %s symbols<br>',ue,self.ues[ue].symb)
             self.printDebData('+++++++++++++++++++++++++++++++++++'+'<br>')
 
+    def traceMetric(self,ue):
+        """This method returns the symbols allocated to ue, written in its ALLOC trace records."""
+        return ue.symb
+
 class TBqueueTDD: # TB queue!!!
     """
         This class is used to model scheduler TB queue in TDD scheduler.
@@ -718,5 +1034,11 @@ class TBqueueTDD: # TB queue!!!
         if len(self.res)>0:
             return self.res.popleft()
 
+    def removeAll(self):
+        """This method removes all the TBs from the queue and returns them as a list, in queue order."""
+        tbs = list(self.res)
+        self.res.clear()
+        return tbs
+
     def updateSize(self,newSize):
         self.numRes = newSize
@@ -102,8 +102,17 @@ class Slice:
                 self.scs = '15kHz'
                 self.ttiBms = 1
 
+    def closeIdleTTIs(self,t):
+        """This method accounts the TTIs served before time t by the dormant schedulers of the slice."""
+        self.schedulerDL.closeIdleTTIs(t)
+        if self.label != 'LTE':
+            self.schedulerUL.closeIdleTTIs(t)
+
     def updateConfig(self,n):
         """This method updates Slice allocated PRBs."""
+        self.schedulerDL.accountIdleTTIs()
+        if self.label != 'LTE':
+            self.schedulerUL.accountIdleTTIs()
         self.PRBs = n
         self.schedulerDL.nrbUEmax = self.PRBs
         if self.label != 'LTE':
@@ -164,6 +173,9 @@ class SliceDeepMimo(Slice):
         """
             This method updates Slice allocated PRBs.
         """
+        self.schedulerDL.accountIdleTTIs()
+        if self.label != 'LTE':
+            self.schedulerUL.accountIdleTTIs()
         self.assigned_base_prbs = assigned_base_prb_list
         self.PRBs = int(len(assigned_base_prb_list)/self.ttiBms)
         self.schedulerDL.nrbUEmax = self.PRBs
@@ -0,0 +1,114 @@
+"""
+    This module contains the SlotClockEngine class, a synchronous alternative to the per slice
+    queuesOut PEM methods and to the per UE traffic and ingress PEM methods.
+"""
+import heapq
+import math
+
+class SlotClockEngine:
+    """
+        Slot clock engine. It advances every intra slice scheduler of a cell on an integer slot grid,
+        built as the least common multiple of the slices numerologies, and merges the traffic arrivals
+        of all the UEs from a time sorted stream. Slower processes (statistics, inter slice scheduler,
+        radio links and scene updates) keep running as PEM methods on the SimPy environment, which is
+        stepped up to each slot boundary.
+    """
+    def __init__(self,env,cell):
+        self.env = env
+        self.cell = cell
+        cell.slotClock = self
+        self.now = 0.0
+        """Current slot boundary time, in ms"""
+        self.users = []
+        """List of UEs whose traffic is handled by the engine"""
+        self.tSims = []
+        """List with the simulation duration of each UE traffic flow"""
+        self.schedulers = []
+        """List of intra slice schedulers handled by the engine"""
+        self.k = 0
+        """Index of the next slot to run"""
+        self.pending = []
+        """List of flags indicating if each scheduler has TBs allocated to be served at its next TTI boundary"""
+
+    def addUE(self,user,tSim):
+        """This method registers a UE. Its packet flow arrivals are generated by the engine instead of queueAppPckt PEM."""
+        self.users.append(user)
+        self.tSims.append(tSim)
+
+    def addScheduler(self,sch):
+        """This method registers an intra slice scheduler. It is run by the engine instead of queuesOut PEM."""
+        self.schedulers.append(sch)
+        self.pending.append(False)
+
+    def flowArrivals(self,i,user,tSim):
+        """This generator yields (arrival time, UE index, packet size) tuples for the UE packet flow."""
+        for t,size in user.packetFlows[0].arrivals(tSim):
+            yield t,i,size
+
+    def slotsByms(self):
+        """This method returns the number of slots by ms of the engine grid, the LCM of the schedulers ttiByms."""
+        L = 1
+        for sch in self.schedulers:
+            L = L*sch.ttiByms//math.gcd(L,sch.ttiByms)
+        return L
+
+    def run(self,until,checkpointInterv=None,checkpoint=None):
+        """
+            This method runs the simulation until time until. See slots for details.
+        """
+        for t in self.slots(until,checkpointInterv,checkpoint):
+            pass
+        self.env.run(until=until)
+
+    def slots(self,until,checkpointInterv=None,checkpoint=None):
+        """
+            This generator runs the slots until time until, yielding the time of each slot once it has been run,
+            so several engines can be driven in lockstep. At each slot boundary it steps the SimPy environment,
+            moves the arrived packets to the bearers, and for each scheduler whose TTI starts at that slot it serves
+            the TBs of the previous TTI and performs the resource allocation of the next one.
+            Drained schedulers skip their TTIs as in sleepWhileDrained.
+            If checkpointInterv is set, the checkpoint function is called with the current time every checkpointInterv ms,
+            once the SimPy environment has been stepped up to that slot boundary.
+            The engine state is kept in its attributes, so a restored engine resumes from the next slot.
+        """
+        env = self.env
+        L = self.slotsByms()
+        period = [L//sch.ttiByms for sch in self.schedulers]
+        pending = self.pending
+        arrivals = heapq.merge(*[self.flowArrivals(i,user,self.tSims[i]) for i,user in enumerate(self.users)])
+        nextArr = next(arrivals,None)
+        kStart = self.k
+        kCheckpoint = int(round(checkpointInterv*L)) if checkpointInterv else 0
+        for k in range(kStart,int(math.ceil(until*L))):
+            t = float(k)/L
+            self.k = k
+            self.now = t
+            while env.peek() <= t:
+                env.step()
+            if kCheckpoint and k > kStart and k%kCheckpoint == 0:
+                checkpoint(t)
+            touched = []
+            while nextArr is not None and nextArr[0] <= t:
+                tArr,i,size = nextArr
+                self.users[i].packetFlows[0].insertAppPckt(size,tArr)
+                touched.append(i)
+                nextArr = next(arrivals,None)
+            for i in touched:
+                self.users[i].moveAppPckts(self.cell)
+            for j,sch in enumerate(self.schedulers):
+                if k%period[j]:
+                    continue
+                if pending[j]:
+                    sch.serveTBs(t)
+                if sch.isDrained() and sch.ttisToSignalling() != 0:
+                    sch.skipTTIs(1)
+                    pending[j] = False
+                else:
+                    if sch.dbMd:
+                        sch.printQstate(self)
+                    if sch.trace is not None:
+                        sch.traceQstate(self.now)
+                    sch.queueUpdate()
+                    pending[j] = True
+            yield t
+        self.k = int(math.ceil(until*L))
@@ -7,23 +7,22 @@ from collections import deque
 import numpy as np
 from regex import F
 from Results import (
-	printResults, getKPIs, makePlotsIntra, getKPIsInter, makePlotsInter
+	printResults, getAvKPIs, getKPIs, makePlotsIntra, getKPIsInter, makePlotsInter
 )
 from utilities import (
-    initialSinrGenerator, Format
+    initialSinrGenerator, Format, timeToNextMultiple
 )
 from channel import (
-    RadioLink, RadioLinkDeepMimo
+    RadioLink, RadioLinkDeepMimo,
+    DEEPMIMO_DATAFILE_PREFIX, DEEPMIMO_DATAFILE_SUFFIX, DEEPMIMO_DATAFILE_ARR_NAME_SNR,
+    DEEPMIMO_DATAFILE_ARR_NAME_RANK, DEEPMIMO_DATAFILE_ARR_NAME_DEGREE
 )
 from packet import (
-    PacketFlow, Bearer
+    PacketFlow, Bearer, SegmentTracker
 )
-
-DEEPMIMO_DATAFILE_PREFIX = 'Data_'
-DEEPMIMO_DATAFILE_SUFFIX = '.npz'
-DEEPMIMO_DATAFILE_ARR_NAME_SNR = 'SNR'
-DEEPMIMO_DATAFILE_ARR_NAME_RANK = 'rank'
-DEEPMIMO_DATAFILE_ARR_NAME_DEGREE = 'DoA'
+from uestate import stateProperty, pastTbszProperty
+from debuglog import WARNING
+from schedtrace import PACKET_LOST
 
 
 class UeGroupBase:
@@ -60,6 +59,8 @@ class UeGroupBase:
         """Meassurement time granularity"""
         self.setReq(dly,avlty)
         self.schIn = cell.sch
+        self.slotClock = cell.slotClock
+        """Slot clock engine driving traffic and intra slice schedulers. None when they run as PEM methods"""
     
     def setReq(self,delay,avl):
         """
@@ -79,6 +80,10 @@ class UeGroupBase:
         users = []
         flows = []
 
+        if self.slotClock is None and cell.ingressClock is None:
+            cell.ingressClock = IngressClock(cell)
+            env.process(cell.ingressClock.run(env))
+
         for j in range (num_users):
             ue_name = 'ue' + str(j+1)
             users.append(UE(ue_name,float(sinr_0[j])))
@@ -86,20 +91,45 @@ class UeGroupBase:
             users[j].addPacketFlow(flows[j])
             users[j].packetFlows[0].setQosFId(1)
             # Flow, UE and RL PEM activation
-            env.process(users[j].packetFlows[0].queueAppPckt(env,tSim=t_sim))
-            env.process(users[j].receivePckt(env,c=cell))
+            if self.slotClock is None:
+                env.process(users[j].packetFlows[0].queueAppPckt(env,tSim=t_sim))
+                env.process(users[j].receivePckt(env,c=cell))
+                cell.ingressClock.addUE(users[j])
+            else:
+                self.slotClock.addUE(users[j],t_sim)
 
         return users,flows
     
     def activateSliceScheds(self,interSliceSche,env):
         """
             This method activates PEM methods from the intra Slice schedulers.
+            If the cell has a slot clock engine, schedulers are registered on it instead.
         """
+        if self.slotClock is not None:
+            if self.num_usersDL>0:
+                self.slotClock.addScheduler(interSliceSche.slices[self.label].schedulerDL)
+            if self.num_usersUL>0:
+                self.slotClock.addScheduler(interSliceSche.slices[self.label].schedulerUL)
+            return
         if self.num_usersDL>0:
             procSchDL = env.process(interSliceSche.slices[self.label].schedulerDL.queuesOut(env))
         if self.num_usersUL>0:
             procSchUL = env.process(interSliceSche.slices[self.label].schedulerUL.queuesOut(env))
 
+    def getSliceKPIs(self,interSliceSche,t_sim):
+        """
+            This method returns a list with the main simulation results of the slice, one dictionary by direction.
+        """
+        kpis = []
+        if self.num_usersDL>0:
+            kpis.append(getAvKPIs('DL',self.usersDL,self.num_usersDL,interSliceSche.slices[self.label].schedulerDL,t_sim))
+        if self.num_usersUL>0:
+            kpis.append(getAvKPIs('UL',self.usersUL,self.num_usersUL,interSliceSche.slices[self.label].schedulerUL,t_sim))
+        for k in kpis:
+            k['slice'] = self.label
+            k['scheduler'] = self.sch
+        return kpis
+
     def printSliceResults(self,interSliceSche,t_sim,bw,measInterv):
         """
             This method prints main simulation results on the terminal, gets the considered kpi 
@@ -179,13 +209,15 @@ class UEgroup(UeGroupBase):
 class UeGroupDeepMimo(UeGroupBase):
     def __init__(
         self, nuDL, nuUL, pszDL, pszUL, parrDL, parrUL, label, dly, avlty, schedulerType, mmMd, lyrs,
-        cell, t_sim, measInterv, env, ueg_dir, is_dynamic, scene_duration
+        cell, t_sim, measInterv, env, ueg_dir, is_dynamic, scene_duration, channel_store=None
     ):
         super(UeGroupDeepMimo, self).__init__(
             nuDL, nuUL, pszDL, pszUL, parrDL, parrUL, label, dly, avlty, schedulerType, mmMd, lyrs,
             cell, t_sim, measInterv, env
         )
-        self.ue_group_dir = ueg_dir.strip('/')
+        self.ue_group_dir = ueg_dir.rstrip('/')
+        self.channel_store = channel_store
+        """ChannelStateStore with the channel status of all scenes. If None, scene files are read from ue_group_dir"""
         self.current_scene = 0
         self.is_dynamic = is_dynamic
         self.scene_duration = scene_duration
@@ -228,6 +260,10 @@ class UeGroupDeepMimo(UeGroupBase):
         cant_ue_to_read = self.num_usersDL if dir == 'DL' else self.num_usersUL
         initial_snrs, initial_ranks, initial_degrees = self.read_ues_channel_status(cant_ue_to_read)
 
+        if self.slotClock is None and cell.ingressClock is None:
+            cell.ingressClock = IngressClock(cell)
+            env.process(cell.ingressClock.run(env))
+
         for j in range (num_users):
             ue_name = 'ue' + str(j+1)
             users.append(UeDeepMimo(ue_name, initial_snrs[j,:], initial_ranks[j,:], initial_degrees[j,:]))
@@ -235,8 +271,12 @@ class UeGroupDeepMimo(UeGroupBase):
             users[j].addPacketFlow(flows[j])
             users[j].packetFlows[0].setQosFId(1)
             # Flow, UE and RL PEM activation
-            env.process(users[j].packetFlows[0].queueAppPckt(env,tSim=t_sim))
-            env.process(users[j].receivePckt(env,c=cell))
+            if self.slotClock is None:
+                env.process(users[j].packetFlows[0].queueAppPckt(env,tSim=t_sim))
+                env.process(users[j].receivePckt(env,c=cell))
+                cell.ingressClock.addUE(users[j])
+            else:
+                self.slotClock.addUE(users[j],t_sim)
         
         if self.is_dynamic:
             env.process(self.pem_update_ue_group_rl(env, t_sim))
@@ -247,6 +287,9 @@ class UeGroupDeepMimo(UeGroupBase):
         """
             This method returns a list containing SINRs of UEgroup at moment=time
         """
+        if self.channel_store is not None:
+            return self.channel_store.read_scene(cant_ue, time)
+
         file_name = DEEPMIMO_DATAFILE_PREFIX + str(time) + DEEPMIMO_DATAFILE_SUFFIX
         file_path = self.ue_group_dir + '/' + file_name
         ueg_channel_status = np.load(file_path)
@@ -262,7 +305,7 @@ class UeGroupDeepMimo(UeGroupBase):
             This PEM method updates all UE's radio link quality in the group
         """
         while env.now<(tSim*0.83):
-            yield env.timeout(self.scene_duration)
+            yield env.timeout(timeToNextMultiple(env.now, self.scene_duration))
             self.update_ue_group_rl()
             self.current_scene += 1
     
@@ -290,14 +333,33 @@ class UeBase:
     """
         This class is used to model UE behabiour and relative properties
     """
+    MCS = stateProperty('MCS')
+    bler = stateProperty('bler')
+    tbsz = stateProperty('tbsz')
+    prbs = stateProperty('prbs')
+    pfFactor = stateProperty('pfFactor')
+    pastTbsz = pastTbszProperty()
+    resUse = stateProperty('resUse')
+    TXedTB = stateProperty('TXedTB')
+    lostTB = stateProperty('lostTB')
+    assigned_layers = stateProperty('assigned_layers')
+    """Scheduler state attributes, kept in the scheduler UeStateStore once the UE is attached to it (see uestate module)"""
+
     def __init__(self, id):
+        self.stateStore = None
+        """UeStateStore holding the UE scheduler state, None if the state is kept in the UE itself"""
+        self.stateRow = None
+        """Row of the UE in its stateStore"""
         self.id = id
+        self.idx = int(id[2:])
+        """Integer index of the UE, taken from its 'ueN' identifier"""
         self.state = 'RRC-IDLE'
         self.packetFlows = []
         self.bearers = []
 
         self.TBid = 1
-        self.pendingPckts = {}
+        self.segments = SegmentTracker()
+        """Segmentation tracker of the UE packets sent in TBs"""
 
         self.resUse = 0
         self.pendingTB = []
@@ -306,11 +368,11 @@ class UeBase:
         self.MCS = 0
         self.pfFactor = 1 # PF Scheduler
         self.pastTbsz = deque([1]) # PF Scheduler
-        self.lastDen = 0.001 # PF Scheduler
-        self.num = 0 # PF Scheduler
 
         self.TXedTB = 1
         self.lostTB = 0
+        self.blerStream = None
+        """Random source with a random method for the TB BLER draws. If None, the global random generator is used"""
         self.symb = 0
 
         self.prbs = 0
@@ -325,39 +387,55 @@ class UeBase:
     def receivePckt(self,env,c): # PEM -------------------------------------------
         """
             This method takes packets on the application buffers and leave them on the bearer buffers.
-            This is a PEM method.
+            This is a PEM method. It sleeps until the packet flow stores a packet in the application buffer,
+            and then hands the UE to the cell ingress clock, which moves its packets to the bearer buffer (see IngressClock).
         """
         while True:
-            if len(self.packetFlows[0].appBuff.pckts)>0:
-                if self.state == 'RRC-IDLE': # Not connected
-                    self.connect(c)
-                    nextPackTime = c.tUdQueue
-                    yield env.timeout(nextPackTime)
-                    if nextPackTime > c.inactTimer:
-                        self.releaseConnection(c)
-                else: # Already connecter user
-                    self.queueDataPckt(c)
-                    nextPackTime = c.tUdQueue
-                    yield env.timeout(nextPackTime)
-                    if nextPackTime > c.inactTimer:
-                        self.releaseConnection(c)
-            else:
-                nextPackTime = c.tUdQueue
-                yield env.timeout(nextPackTime)
+            yield self.packetFlows[0].waitAppPckt(env)
+            c.ingressClock.addPending(self)
+
+    def moveAppPckt(self,c):
+        """
+            This method moves the first packet in the application buffer to the bearer buffer.
+            If the UE is in RRC-IDLE state, the packet is moved by the connection.
+        """
+        if self.state == 'RRC-IDLE': # Not connected
+            self.connect(c)
+        else:
+            self.queueDataPckt(c)
+
+    def moveAppPckts(self,c):
+        """
+            This method moves all the packets in the application buffer to the bearer buffer,
+            connecting the UE first if it is in RRC-IDLE state.
+        """
+        if self.state == 'RRC-IDLE': # Not connected
+            self.connect(c)
+        while len(self.packetFlows[0].appBuff.pckts)>0:
+            self.queueDataPckt(c)
     
     def connect(self,cl):
         """
             This method creates bearers and bearers buffers.
         """
-        bD = Bearer(1,9,self.packetFlows[0].type)
+        if self.packetFlows[0].type == 'DL':
+            sch = cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL
+        else:
+            sch = cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL
+        bD = Bearer(1,9,self.packetFlows[0].type,sch.bearerTotals)
         self.addBearer(bD)
         self.queueDataPckt(cl)
         if self.packetFlows[0].type == 'DL':
             if (list(cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.ues.keys()).count(self.id))<1:
                 cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.ues[self.id] = self
+                cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.uesByIdx[self.idx] = self
         else:
             if (list(cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.ues.keys()).count(self.id))<1:
                 cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.ues[self.id] = self
+                cl.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.uesByIdx[self.idx] = self
+        if sch.stateStore is not None and self.stateStore is None:
+            sch.stateStore.attach(self)
+        self.radioLinks.scheduler = sch
         self.state = 'RRC-CONNECTED'
     
     def queueDataPckt(self,cell):
@@ -365,34 +443,25 @@ class UeBase:
             This method queues the packets taken from the application buffer in the bearer buffers.
         """
         pD = self.packetFlows[0].appBuff.removePckt()
-        buffSizeAllUEs = 0
-        buffSizeThisUE = 0
-        if self.packetFlows[0].type == 'DL':
-            for ue in list(cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.ues.keys()):
-                buffSizeUE = 0
-                for p in cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.ues[ue].bearers[0].buffer.pckts:
-                    buffSizeUE = buffSizeUE + p.size
-                if self.id == ue:
-                    buffSizeThisUE = buffSizeUE
-                buffSizeAllUEs = buffSizeAllUEs + buffSizeUE
-        else:
-            for ue in list(cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.ues.keys()):
-                buffSizeUE = 0
-                for p in cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.ues[ue].bearers[0].buffer.pckts:
-                    buffSizeUE = buffSizeUE + p.size
-                if self.id == ue:
-                    buffSizeThisUE = buffSizeUE
-                buffSizeAllUEs = buffSizeAllUEs + buffSizeUE
+        buffSizeThisUE = self.bearers[0].buffer.bytes
 
         if buffSizeThisUE<cell.maxBuffUE:#len(self.bearers[1].buffer.pckts)<cell.maxBuffUE:
             self.bearers[0].buffer.insertPckt(pD)
+            if self.packetFlows[0].type == 'DL':
+                cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.bearerPcktIn()
+            else:
+                cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.bearerPcktIn()
         else:
             pcktN = pD.secNum
             #print (Format.CRED+Format.CBOLD+self.id,'packet ',pcktN,' lost .....',str(pD.tIn)+Format.CEND)
             if self.packetFlows[0].type == 'DL':
-                cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL.printDebDataDM('<p style="color:red"><b>'+str(self.id)+' packet '+str(pcktN)+' lost .....'+str(pD.tIn)+'</b></p>')
+                sch = cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerDL
             else:
-                cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL.printDebDataDM('<p style="color:red"><b>'+str(self.id)+' packet '+str(pcktN)+' lost .....'+str(pD.tIn)+'</b></p>')
+                sch = cell.interSliceSched.slices[self.packetFlows[0].sliceName].schedulerUL
+            if sch.dbMd:
+                sch.printDeb(WARNING,self.id,'<p style="color:red"><b>%s packet %s lost .....%s</b></p>',self.id,pcktN,pD.tIn)
+            if sch.trace is not None:
+                sch.trace.record(PACKET_LOST,sch.sbFrNum,self.idx,pcktN,pD.tIn)
             self.packetFlows[0].lostPackets = self.packetFlows[0].lostPackets + 1
     
     def releaseConnection(self,cl):
@@ -448,3 +517,53 @@ class UeDeepMimo(UeBase):
         self.prbs += cant_prbs
 
 
+
+
+class IngressClock:
+    """
+        Bearer ingress clock of the UEs of a cell. While any UE has packets in its application buffer,
+        it moves one packet of each of those UEs to its bearer buffer every tUdQueue, in the UEs creation order,
+        and it sleeps while all the application buffers are empty.
+        The queue update instants are accumulated from the PEM start, as in a tUdQueue polling loop,
+        so they keep the same time values and the same order with the other simulation events.
+    """
+    def __init__(self, cell):
+        self.cell = cell
+        self.order = {}
+        """Dictionary with the creation order of each UE"""
+        self.pending = {}
+        """Dictionary with the UEs having packets in their application buffer, by creation order"""
+        self.wakeEvent = None
+        """Event triggered when a UE is added to pending while the clock sleeps"""
+
+    def addUE(self, ue):
+        """This method registers a UE, after the ones registered before."""
+        self.order[ue] = len(self.order)
+
+    def addPending(self, ue):
+        """This method adds a UE with packets in its application buffer, waking up the clock if it sleeps."""
+        self.pending[self.order[ue]] = ue
+        if self.wakeEvent is not None and not self.wakeEvent.triggered:
+            self.wakeEvent.succeed()
+
+    def run(self, env): # PEM -------------------------------------------
+        """
+            This method moves the pending UEs packets to the bearer buffers at each queue update instant.
+            This is a PEM method.
+        """
+        tick = env.now # next queue update instant
+        while True:
+            if len(self.pending)==0:
+                self.wakeEvent = env.event()
+                yield self.wakeEvent
+                while tick < env.now:
+                    tick = tick + self.cell.tUdQueue
+                if tick > env.now:
+                    yield env.timeout(tick - env.now)
+            for i in sorted(self.pending):
+                ue = self.pending[i]
+                ue.moveAppPckt(self.cell)
+                if len(ue.packetFlows[0].appBuff.pckts)==0:
+                    del self.pending[i]
+            yield env.timeout(self.cell.tUdQueue)
+            tick = env.now
@@ -0,0 +1,115 @@
+"""
+    This is the micro benchmark script of the simulator.
+    Each benchmark builds simulator objects, or runs a short simulation, and reports the elapsed
+    time and the memory allocated for them, measured with tracemalloc.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import simpy
+import IntraSliceSch
+from IntraSliceSch import IntraSliceScheduler, LTE_scheduler, TransportBlock
+from packet import Packet
+from Cell import Cell
+from UE import UEgroup
+from SlotClock import SlotClockEngine
+
+def measure(build):
+    """This method calls build and returns its result along with the elapsed time in s and the allocated memory in bytes."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - t0
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, allocated
+
+def buildSlices(nSlices, shared):
+    """
+        This method builds the DL and UL intra slice schedulers of nSlices 5G slices and nSlices LTE slices.
+        If shared is False, the shared tables are dropped before each scheduler is built, so every scheduler
+        builds its own copy of the tables as before they were shared.
+    """
+    schedulers = []
+    for i in range(nSlices):
+        for dir in ['DL', 'UL']:
+            if not shared:
+                IntraSliceSch.SHARED_TABLES.clear()
+            schedulers.append(IntraSliceScheduler('n78', 100, False, 0.5, 2, 'SU', 1, dir, 14, False, 'S'+str(i), 'RR'))
+        if not shared:
+            IntraSliceSch.SHARED_TABLES.clear()
+        schedulers.append(LTE_scheduler('B1', 20, False, 0.5, 'SU', 1, 'DL'))
+    return schedulers
+
+def benchSchedulerTables(nSlices):
+    """
+        This method compares the construction time and memory of the intra slice schedulers of nSlices slices,
+        with AMC tables shared by all the schedulers and with a copy of the tables by scheduler.
+    """
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmpDir:
+        os.chdir(tmpDir) # Schedulers open their log files in Logs/
+        try:
+            for shared in [False, True]:
+                IntraSliceSch.SHARED_TABLES.clear()
+                schedulers, elapsed, allocated = measure(lambda: buildSlices(nSlices, shared))
+                results[shared] = (elapsed, allocated)
+                for sch in schedulers:
+                    sch.closeLogs()
+        finally:
+            os.chdir(cwd)
+    print('Intra slice schedulers of %d slices (%d schedulers)' % (nSlices, 3*nSlices))
+    for shared in [False, True]:
+        elapsed, allocated = results[shared]
+        print('%-14s %8.1f ms %10.1f kB %8.1f kB by slice' % ('shared tables' if shared else 'own tables', 1000*elapsed, allocated/1024.0, allocated/1024.0/nSlices))
+    return results
+
+def benchObjects(n):
+    """This method reports the memory by object of n packets and n transport blocks."""
+    pckts, elapsed, pcktBytes = measure(lambda: [Packet(i, 100, 1, 'ue1') for i in range(n)])
+    tbs, elapsed, tbBytes = measure(lambda: [TransportBlock(i, '4-QAM', 1, 'data', None, 4, 100) for i in range(n)])
+    print('%d objects: %6.1f B by Packet, %6.1f B by TransportBlock' % (n, float(pcktBytes)/n, float(tbBytes)/n))
+    return pcktBytes, tbBytes
+
+def runMMTC(nUEs, tSim):
+    """This method runs a single mMTC slice cell with nUEs UEs, half DL and half UL, in slot clock mode for tSim ms."""
+    env = simpy.Environment()
+    cell = Cell('c1', [20], 'FR1', False, 81920, False, 1000.0, 'RR')
+    engine = SlotClockEngine(env, cell)
+    group = UEgroup(nUEs//2, nUEs - nUEs//2, 100, 100, 1000, 1000, 'mMTC', 20, '', 'RR', 'MU', 2, cell, tSim, 100.0, env, 'S15')
+    cell.interSliceSched.createSlice(group.req['reqDelay'], group.req['reqThroughputDL'], group.req['reqThroughputUL'], group.req['reqAvailability'],
+        group.num_usersDL, group.num_usersUL, 'B1', False, group.mmMd, group.lyrs, group.label, group.sch)
+    env.process(cell.updateStsts(env, interv=100.0, tSim=tSim))
+    env.process(cell.interSliceSched.resAlloc(env))
+    group.activateSliceScheds(cell.interSliceSched, env)
+    engine.run(until=tSim)
+    return group
+
+def benchMMTC(nUEs, tSim):
+    """This method reports the run time and the memory held at the end of a tSim ms mMTC run with nUEs UEs."""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmpDir:
+        os.chdir(tmpDir) # Statistics and logs are written in the working directory
+        try:
+            group, elapsed, allocated = measure(lambda: runMMTC(nUEs, tSim))
+        finally:
+            os.chdir(cwd)
+    print('mMTC run with %d UEs, %d ms: %8.1f s %10.1f kB %8.1f B by UE' % (nUEs, tSim, elapsed, allocated/1024.0, float(allocated)/nUEs))
+    return elapsed, allocated
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs the simulator micro benchmarks.')
+    parser.add_argument('--slices', type=int, default=50, help='number of slices for the scheduler tables benchmark')
+    parser.add_argument('--objects', type=int, default=100000, help='number of packets and TBs for the objects benchmark')
+    parser.add_argument('--ues', type=int, default=10000, help='number of UEs for the mMTC benchmark')
+    parser.add_argument('--t-sim', type=int, default=500, help='simulation duration in ms for the mMTC benchmark')
+    args = parser.parse_args()
+
+    benchSchedulerTables(args.slices)
+    benchObjects(args.objects)
+    benchMMTC(args.ues, args.t_sim)
@@ -2,10 +2,21 @@
     This module contains channel status related classes.
 """
 
+import math
+import os
 import random
 import numpy as np
 
 
+DEEPMIMO_DATAFILE_PREFIX = 'Data_'
+DEEPMIMO_DATAFILE_SUFFIX = '.npz'
+DEEPMIMO_DATAFILE_ARR_NAME_SNR = 'SNR'
+DEEPMIMO_DATAFILE_ARR_NAME_RANK = 'rank'
+DEEPMIMO_DATAFILE_ARR_NAME_DEGREE = 'DoA'
+DEEPMIMO_DATAFILE_ARR_NAMES = [
+    DEEPMIMO_DATAFILE_ARR_NAME_SNR, DEEPMIMO_DATAFILE_ARR_NAME_RANK, DEEPMIMO_DATAFILE_ARR_NAME_DEGREE
+]
+
 SUB_CARRIER_SPACING_LIST = ['15khz', '30khz', '60khz', '120khz']
 SUB_CARRIER_SPACING_LIST_FR1 = ['15khz', '30khz', '60khz']
 SUB_CARRIER_SPACING_LIST_FR2 = ['60khz', '120khz']
@@ -17,6 +28,11 @@ CANT_BASE_PRB_IN_PRB_BY_SCS = {
     '120khz': 8
 }
 
+BER = 0.01
+"""Target BER of the PRB capacity term log2(1+B*snr)"""
+CAPACITY_B = -1.5/math.log(5*BER)
+"""SNR gap factor B of the PRB capacity term for the target BER"""
+
 
 class RadioLink():
 	"""
@@ -29,6 +45,8 @@ class RadioLink():
 		self.ue = u
 		self.totCount = 0
 		self.maxVar = 0.1
+		self.scheduler = None
+		"""Intra slice scheduler of the UE, whose dormant TTIs are accounted before the link quality changes"""
 
 	def updateLQ(self,env,udIntrv,tSim,fl,u,r):
 		"""
@@ -42,6 +60,8 @@ class RadioLink():
 			deltaSINR = random.normalvariate(0, self.maxVar)
 			while deltaSINR > self.maxVar or deltaSINR<(0-self.maxVar):
 				deltaSINR = random.normalvariate(0, self.maxVar)
+			if self.scheduler is not None:
+				self.scheduler.accountIdleTTIs()
 			self.linkQuality = self.linkQuality + deltaSINR
 
 	def update_link_quality_from_value(self, lq):
@@ -61,12 +81,40 @@ class RadioLinkDeepMimo:
         self.rank = []
         self.degree = []
         self.linkQuality = 0
+        self.epoch = 0
+        """Number of link status updates, so schedulers can tell when the scene changed"""
+        self.prb_snr = {}
+        """Dictionary with the mean SNR of each PRB, by numerology (base PRBs by PRB)"""
+        self.prb_rank = {}
+        """Dictionary with the minimum rank of each PRB, by numerology (base PRBs by PRB)"""
+        self.prb_capacity = {}
+        """Dictionary with the capacity term log2(1+B*snr) of each PRB, by numerology (base PRBs by PRB)"""
     
     def update_link_status(self, snr, rank, degree):
         self.snr = snr
         self.rank = rank
         self.degree = degree
         self.linkQuality = np.mean(snr)
+        self.epoch = self.epoch + 1
+        self.update_prb_status()
+
+    def update_prb_status(self):
+        """
+            This method precomputes the mean SNR, the minimum rank and the capacity term of the PRBs of every numerology
+            in CANT_BASE_PRB_IN_PRB_BY_SCS, once by scene. The PRB i of a numerology with n base PRBs by PRB is made of the
+            base PRBs n*i to n*(i+1)-1, so schedulers read the values of a PRB by indexing these arrays.
+        """
+        snr = np.asarray(self.snr, dtype=float)
+        rank = np.asarray(self.rank)
+        for num in sorted(set(CANT_BASE_PRB_IN_PRB_BY_SCS.values())):
+            starts = np.arange(0, len(snr), num)
+            if len(starts) == 0:
+                self.prb_snr[num] = np.zeros(0)
+                self.prb_rank[num] = np.zeros(0, dtype=rank.dtype)
+            else:
+                self.prb_snr[num] = np.add.reduceat(snr, starts)/np.minimum(num, len(snr) - starts)
+                self.prb_rank[num] = np.minimum.reduceat(rank, starts)
+            self.prb_capacity[num] = np.log2(1 + CAPACITY_B*self.prb_snr[num])
     
     def get_radio_link_quality_over_assigned_prbs(self) -> tuple:
         assigned_prb_list = self.ue.assigned_base_prbs
@@ -82,3 +130,48 @@ class RadioLinkDeepMimo:
         else:
             return (0, 0)
 
+
+class ChannelStateStore:
+    """
+        This class holds the channel status of all the scenes of a DeepMIMO UE group as read only arrays
+        with (scene, UE, base PRB) shape. The arrays can be saved as .npy files and memory mapped, so
+        simulations running in different processes share the same physical pages instead of each one
+        loading its own copy of the scenario.
+    """
+    def __init__(self, arrays):
+        self.arrays = arrays
+        """Dictionary with the SNR, rank and DoA arrays of the UE group"""
+        self.cant_scenes = arrays[DEEPMIMO_DATAFILE_ARR_NAME_SNR].shape[0]
+
+    @classmethod
+    def from_ue_group_dir(cls, ueg_dir):
+        """This method reads all the scene files (Data_<scene>.npz) of a UE group directory."""
+        scenes = []
+        while os.path.exists(cls.scene_file_path(ueg_dir, len(scenes))):
+            scenes.append(np.load(cls.scene_file_path(ueg_dir, len(scenes))))
+        arrays = {}
+        for arr_name in DEEPMIMO_DATAFILE_ARR_NAMES:
+            arrays[arr_name] = np.stack([scene[arr_name] for scene in scenes])
+        return cls(arrays)
+
+    @staticmethod
+    def scene_file_path(ueg_dir, time):
+        return ueg_dir + '/' + DEEPMIMO_DATAFILE_PREFIX + str(time) + DEEPMIMO_DATAFILE_SUFFIX
+
+    def save(self, store_dir):
+        """This method saves the arrays as .npy files in store_dir, so they can be memory mapped with load."""
+        os.makedirs(store_dir, exist_ok=True)
+        for arr_name in DEEPMIMO_DATAFILE_ARR_NAMES:
+            np.save(os.path.join(store_dir, arr_name + '.npy'), self.arrays[arr_name])
+
+    @classmethod
+    def load(cls, store_dir):
+        """This method memory maps in read only mode the arrays saved in store_dir."""
+        arrays = {}
+        for arr_name in DEEPMIMO_DATAFILE_ARR_NAMES:
+            arrays[arr_name] = np.asarray(np.load(os.path.join(store_dir, arr_name + '.npy'), mmap_mode='r'))
+        return cls(arrays)
+
+    def read_scene(self, cant_ue, time):
+        """This method returns the SNR, rank and DoA arrays of the first cant_ue UEs at scene time."""
+        return tuple(self.arrays[arr_name][time, 0:cant_ue, :] for arr_name in DEEPMIMO_DATAFILE_ARR_NAMES)
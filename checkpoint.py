@@ -0,0 +1,81 @@
+"""
+    This module contains the simulation checkpoint functions.
+    A checkpoint is a pickle of the simulation objects (cell, schedulers, UE groups, UEs, buffers and
+    slot clock engine) along with the random generators state. The SimPy environment and its PEM methods
+    are not stored: they are created again when the checkpoint is restored. Open statistics, log and trace files
+    are stored as their name and offset, and they are truncated (or copied up to that offset, when
+    the checkpoint is restored in another directory) on restore.
+"""
+import io
+import os
+import pickle
+import random
+import numpy as np
+import simpy
+
+class CheckpointPickler(pickle.Pickler):
+    """Pickler storing open files as (name, offset) and dropping SimPy objects."""
+    def persistent_id(self, obj):
+        if isinstance(obj, io.TextIOBase):
+            obj.flush()
+            return ('file', obj.name, os.path.abspath(obj.name), obj.tell())
+        if isinstance(obj, (io.BufferedWriter, io.BufferedRandom)):
+            obj.flush()
+            return ('binfile', obj.name, os.path.abspath(obj.name), obj.tell())
+        if isinstance(obj, (simpy.Environment, simpy.events.Event)):
+            return ('simpy',)
+        return None
+
+class CheckpointUnpickler(pickle.Unpickler):
+    """Unpickler reopening the files stored by CheckpointPickler at their offset."""
+    def persistent_load(self, pid):
+        if pid[0] == 'file':
+            return reopenFile(pid[1], pid[2], pid[3])
+        if pid[0] == 'binfile':
+            return reopenFile(pid[1], pid[2], pid[3], 'r+b')
+        return None
+
+def reopenFile(name, srcPath, offset, mode='r+'):
+    """
+        This method opens the file name for writing at offset, in mode ('r+' for text files, 'r+b' for binary files).
+        If it is not the file where the checkpoint was taken from, the first offset bytes of that file are copied first.
+    """
+    if os.path.abspath(name) != srcPath:
+        with open(srcPath, 'rb') as src, open(name, 'wb') as dst:
+            dst.write(src.read(offset))
+    f = open(name, mode)
+    f.seek(offset)
+    f.truncate()
+    return f
+
+def saveCheckpoint(path, state):
+    """
+        This method saves the state dictionary, along with the global random generators state, on path.
+        The file is written atomically, so a crash while saving does not corrupt a previous checkpoint.
+    """
+    state = dict(state)
+    state['random'] = random.getstate()
+    state['npRandom'] = np.random.get_state()
+    dirName = os.path.dirname(path)
+    if dirName:
+        os.makedirs(dirName, exist_ok=True)
+    with open(path + '.tmp', 'wb') as f:
+        CheckpointPickler(f, pickle.HIGHEST_PROTOCOL).dump(state)
+    os.replace(path + '.tmp', path)
+
+def loadCheckpoint(path):
+    """This method loads a checkpoint state dictionary and restores the global random generators state."""
+    with open(path, 'rb') as f:
+        state = CheckpointUnpickler(f).load()
+    random.setstate(state['random'])
+    np.random.set_state(state['npRandom'])
+    return state
+
+def resumeProcess(env, period, pem):
+    """
+        This PEM method starts pem at the next multiple of period after the current time. It is used to
+        resume periodic PEM methods which act first and then wait for period, like inter slice schedulers resAlloc.
+    """
+    nextTime = (int(env.now/period) + 1)*period
+    yield env.timeout(nextTime - env.now)
+    yield env.process(pem)
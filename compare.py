@@ -0,0 +1,125 @@
+"""
+    This is the intra slice schedulers comparison script for deepMIMO scenarios.
+    It builds one simulation by scheduler (arm) in the same process and drives their slot clock engines
+    in lockstep, on common random numbers: all the arms share the channel status arrays, the packet
+    arrivals, which are drawn only once, and the BLER random streams of each UE. Therefore KPI differences
+    between arms come from the schedulers and not from the randomness of each run.
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import os
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+from channel import ChannelStateStore
+from utilities import CommonRandomStream, Format
+from simulation_v2 import DEFAULT_CONFIG, build_simulation, finish_simulation
+from sweep import makeConfig
+from profiler import profileCall
+
+COMPARED_KPIS = ['sentPackets', 'lostPackets', 'PLR', 'Throughput', 'MCS']
+"""List of KPI shown side by side for each arm."""
+
+def run_comparison(config, schedulers, seed=0, outDir='Compare'):
+    """
+        This method compares the intra slice schedulers types in the schedulers list, on the configuration
+        config (see simulation_v2.DEFAULT_CONFIG), where the scheduler type of every UE group is replaced.
+        Each arm works in outDir/<scheduler> directory. The side by side KPI table is written to
+        outDir/compare.csv, and it is also returned as a list of dictionaries, one by slice and direction.
+    """
+    outDir = os.path.abspath(outDir)
+    config = copy.deepcopy(config)
+    config['scenario_dir'] = os.path.abspath(config['scenario_dir']) + os.sep
+    config['slotClockMode'] = True
+    channelStores = [ChannelStateStore.from_ue_group_dir(config['scenario_dir'] + 'UEgroup_' + str(i)) for i in range(len(config['UEgroups']))]
+
+    arms = []
+    cwd = os.getcwd()
+    for sch in schedulers:
+        os.makedirs(os.path.join(outDir, sch), exist_ok=True)
+        os.chdir(os.path.join(outDir, sch))
+        try:
+            arms.append(build_simulation(makeConfig(config, {'schedulerType': sch}), seed, channelStores))
+        finally:
+            os.chdir(cwd)
+    shareRandomNumbers([sim for env, sim in arms], seed)
+
+    #----------------------------------------------------------------
+    until = arms[0][1]['duration']
+    for t in itertools.zip_longest(*[sim['engine'].slots(until) for env, sim in arms]):
+        pass
+    for env, sim in arms:
+        env.run(until=until)
+    #----------------------------------------------------------------
+
+    armsKPIs = []
+    for sch, (env, sim) in zip(schedulers, arms):
+        os.chdir(os.path.join(outDir, sch))
+        try:
+            armsKPIs.append(finish_simulation(sim, False))
+        finally:
+            os.chdir(cwd)
+    rows = mergeArmsKPIs(schedulers, armsKPIs)
+
+    fields = ['slice', 'dir', 'users'] + [kpi + '[' + sch + ']' for kpi in COMPARED_KPIS for sch in schedulers]
+    with open(os.path.join(outDir, 'compare.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+def shareRandomNumbers(sims, seed):
+    """
+        This method makes the arms use common random numbers. Arrivals of each flow are drawn once, from
+        the first arm flow, and replayed by the flows of all the arms. Each UE gets a BLER stream shared
+        by the same UE of every arm. UEs are matched by their registration order in the slot clock engines.
+    """
+    streams = np.random.SeedSequence(seed).spawn(len(sims[0]['engine'].users))
+    for i, user in enumerate(sims[0]['engine'].users):
+        tSim = sims[0]['engine'].tSims[i]
+        replay = user.packetFlows[0].drawAllArrivals(tSim)
+        blerStream = CommonRandomStream(np.random.default_rng(streams[i]))
+        for sim in sims:
+            armUser = sim['engine'].users[i]
+            armUser.packetFlows[0].setReplay(replay)
+            armUser.blerStream = blerStream.reader()
+
+def mergeArmsKPIs(schedulers, armsKPIs):
+    """This method returns the KPI of the arms side by side, one row by slice and direction."""
+    rows = []
+    for kpis in zip(*armsKPIs):
+        row = {'slice': kpis[0]['slice'], 'dir': kpis[0]['dir'], 'users': kpis[0]['users']}
+        for sch, kpi in zip(schedulers, kpis):
+            for name in COMPARED_KPIS:
+                row[name + '[' + sch + ']'] = kpi[name]
+        rows.append(row)
+    return rows
+
+def printComparison(schedulers, rows):
+    """This method prints the side by side KPI table on the terminal."""
+    for row in rows:
+        print (Format.CBOLD+Format.CBLUE+'SLICE: '+row['slice']+' '+row['dir']+' ('+str(row['users'])+' UEs)'+Format.CEND)
+        print ('\t'+''.join(['%14s' % sch for sch in schedulers]))
+        for name in COMPARED_KPIS:
+            print (name[:7]+'\t'+''.join(['%14.3f' % row[name + '[' + sch + ']'] for sch in schedulers]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compares intra slice schedulers on DEFAULT_CONFIG with common random numbers.')
+    parser.add_argument('--schedulers', nargs='+', default=['NUM', 'DF'], help='intra slice scheduler types to compare')
+    parser.add_argument('--seed', type=int, default=0, help='seed of traffic and BLER streams')
+    parser.add_argument('--out', default='Compare', help='output directory for arm directories and compare.csv')
+    parser.add_argument('--profile', action='store_true', help='profile the comparison and report the wall time by subsystem')
+    parser.add_argument('--profile-out', default='profile.collapsed', help='collapsed stacks file for flamegraphs')
+    args = parser.parse_args()
+
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    config['debMode'] = False
+    if args.profile:
+        rows = profileCall(args.profile_out, run_comparison, config, args.schedulers, args.seed, args.out)
+    else:
+        rows = run_comparison(config, args.schedulers, args.seed, args.out)
+    printComparison(args.schedulers, rows)
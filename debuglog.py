@@ -0,0 +1,67 @@
+"""
+    This module contains the debug logging layer of the intra slice schedulers.
+    Schedulers in debug mode write their operation to Logs/<slice><dir>dbFile.html through a DebugLog.
+    Records have a level and an optional UE, and their message is only formatted if the record passes
+    the DebugFilter, so debugging one UE of a large run does not build nor write the logs of the others.
+    Call sites check the scheduler dbMd flag first, so logging has no cost out of debug mode.
+"""
+
+DEBUG = 10
+"""Level of the TB, packet and UE scheduling details"""
+INFO = 20
+"""Level of the queues state and resource allocation of each TTI"""
+WARNING = 30
+"""Level of lost packets and TBs"""
+
+DEBUG_BUFFER_SIZE = 1 << 20
+"""Buffer size in bytes of the debug log files"""
+
+class DebugFilter:
+    """
+        Filter of debug records. Records are accepted if their level is level or higher, their scheduler slice
+        label is in slices, their UE is in ues (records without UE, like TTI headers, are always accepted) and the
+        simulation time is in the [tStart, tEnd) window. None means no restriction.
+    """
+    def __init__(self, level=DEBUG, slices=None, ues=None, tStart=None, tEnd=None):
+        self.level = level
+        self.slices = set(slices) if slices is not None else None
+        self.ues = set(ues) if ues is not None else None
+        self.tStart = tStart
+        self.tEnd = tEnd
+
+    def acceptsSlice(self, sliceLabel):
+        """This method returns True if the records of the slice sliceLabel may be accepted."""
+        return self.slices is None or sliceLabel in self.slices
+
+debugFilter = DebugFilter()
+"""DebugFilter used by the schedulers created afterwards"""
+
+def setDebugFilter(filter=None):
+    """This method sets the DebugFilter used by the schedulers created afterwards. None accepts all the records."""
+    global debugFilter
+    debugFilter = filter if filter is not None else DebugFilter()
+
+class DebugLog:
+    """
+        Debug log of a scheduler, writing the records accepted by its filter to the file f.
+        The scheduler updates now with the simulation time, for the filter time window.
+    """
+    def __init__(self, f, filter):
+        self.file = f
+        self.filter = filter
+        self.now = 0.0
+        """Current simulation time of the scheduler, in ms"""
+
+    def log(self, level, ue, fmt, *args):
+        """
+            This method writes the record with the given level and UE identifier (None if the record is not about one UE).
+            The message is fmt % args, and it is only formatted if the record is accepted.
+        """
+        filter = self.filter
+        if level < filter.level:
+            return
+        if ue is not None and filter.ues is not None and ue not in filter.ues:
+            return
+        if (filter.tStart is not None and self.now < filter.tStart) or (filter.tEnd is not None and self.now >= filter.tEnd):
+            return
+        self.file.write(fmt % args if args else fmt)
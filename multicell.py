@@ -0,0 +1,126 @@
+"""
+    This is the multi cell simulation script for deepMIMO scenarios.
+    Each cell, with its own inter slice scheduler, slices and UE groups, is simulated with
+    simulation_v2.run_simulation in its own worker process. The channel status of every UE group is
+    loaded once and stored as memory mapped read only arrays, so it is shared by all the workers.
+    Per cell KPI are merged at the end in a summary table, along with network level KPI by slice.
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')
+from channel import ChannelStateStore
+from simulation_v2 import DEFAULT_CONFIG
+from sweep import runInDir, KPI_FIELDS
+
+NETWORK_CELL_ID = 'network'
+"""Cell identifier used in the summary table for the network level KPI."""
+
+def ueGroupDirs(config):
+    """This method returns the channel status directory of each UE group of a cell configuration."""
+    return [config['scenario_dir'] + 'UEgroup_' + str(i) for i in range(len(config['UEgroups']))]
+
+def shareChannelStates(cellConfigs, storesDir):
+    """
+        This method reads the channel status of every UE group directory used by the cells and saves it
+        in storesDir as .npy arrays. It returns a dictionary with the store directory of each UE group directory.
+        UE group directories used by more than one cell are stored only once.
+    """
+    storeDirs = {}
+    for config in cellConfigs:
+        for uegDir in ueGroupDirs(config):
+            if uegDir not in storeDirs:
+                storeDirs[uegDir] = os.path.join(storesDir, 'store_%03d' % len(storeDirs))
+                ChannelStateStore.from_ue_group_dir(uegDir).save(storeDirs[uegDir])
+    return storeDirs
+
+def runCell(cell, outDir):
+    """
+        This method runs the simulation of a single cell in its own run directory and returns its KPI rows.
+        It is executed by the pool workers. Channel status arrays are memory mapped, not copied.
+    """
+    config, seed, storeDirs = cell
+    channelStores = [ChannelStateStore.load(storeDir) for storeDir in storeDirs]
+    kpis = runInDir(os.path.join(outDir, 'cell_' + config['cellId']), config, seed, channelStores=channelStores)
+    for kpi in kpis:
+        kpi['cell'] = config['cellId']
+    return kpis
+
+def mergeCellKPIs(rows):
+    """
+        This method returns the network level KPI of each slice and direction from the per cell KPI rows.
+        Packet counters are added, PLR is the network packet loss rate, and Throughput and MCS are
+        averaged by user over all the cells.
+    """
+    network = {}
+    for row in rows:
+        key = (row['slice'], row['dir'])
+        if key not in network:
+            network[key] = {'cell': NETWORK_CELL_ID, 'slice': row['slice'], 'scheduler': row['scheduler'], 'dir': row['dir'],
+                'users': 0, 'sentPackets': 0, 'lostPackets': 0, 'Throughput': 0.0, 'MCS': 0.0, 'PRBs': 0, 'Numerology': row['Numerology']}
+        net = network[key]
+        net['users'] = net['users'] + row['users']
+        net['sentPackets'] = net['sentPackets'] + row['sentPackets']
+        net['lostPackets'] = net['lostPackets'] + row['lostPackets']
+        net['Throughput'] = net['Throughput'] + row['Throughput']*row['users']
+        net['MCS'] = net['MCS'] + row['MCS']*row['users']
+        net['PRBs'] = net['PRBs'] + row['PRBs']
+    for net in network.values():
+        net['PLR'] = float(100*net['lostPackets'])/net['sentPackets'] if net['sentPackets'] > 0 else 0.0
+        net['Throughput'] = net['Throughput']/net['users']
+        net['MCS'] = net['MCS']/net['users']
+    return list(network.values())
+
+def run_multicell(cellConfigs, seed=None, outDir='MultiCell', workers=None):
+    """
+        This method simulates every cell configuration (see simulation_v2.DEFAULT_CONFIG) in a pool of
+        worker processes. Cell identifiers must be unique. Each cell is seeded with seed plus its index.
+        The per cell and network KPI are written to outDir/summary.csv and also returned as a list of dictionaries.
+    """
+    outDir = os.path.abspath(outDir)
+    os.makedirs(outDir, exist_ok=True)
+    cellConfigs = copy.deepcopy(cellConfigs)
+    for config in cellConfigs:
+        # Cells are simulated inside their own directories
+        config['scenario_dir'] = os.path.abspath(config['scenario_dir']) + os.sep
+    storeDirs = shareChannelStates(cellConfigs, os.path.join(outDir, 'channels'))
+
+    cells = []
+    for i, config in enumerate(cellConfigs):
+        cellSeed = seed + i if seed is not None else None
+        cells.append((config, cellSeed, [storeDirs[uegDir] for uegDir in ueGroupDirs(config)]))
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for cellRows in pool.map(runCell, cells, itertools.repeat(outDir)):
+            rows.extend(cellRows)
+    rows.extend(mergeCellKPIs(rows))
+
+    with open(os.path.join(outDir, 'summary.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['cell'] + KPI_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs a multi cell simulation with DEFAULT_CONFIG cells.')
+    parser.add_argument('--cells', type=int, default=4, help='number of cells')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first cell')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--out', default='MultiCell', help='output directory for cell directories and summary.csv')
+    args = parser.parse_args()
+
+    cellConfigs = []
+    for i in range(args.cells):
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        config['cellId'] = 'c' + str(i+1)
+        config['debMode'] = False
+        cellConfigs.append(config)
+    rows = run_multicell(cellConfigs, args.seed, args.out, args.workers)
+    print('%d KPI rows written to %s' % (len(rows), os.path.join(args.out, 'summary.csv')))
@@ -2,10 +2,123 @@
     This module containts packet related classes.
 """
 
-import random
+import csv
 from collections import deque
+import numpy as np
 from utilities import Format
 
+PARETO_SHAPE = 1.2
+"""Shape parameter of the Pareto distribution used for packet sizes and inter arrival times"""
+
+TRAFFIC_BLOCK_SIZE = 64
+"""Number of packet sizes (and inter arrival times) drawn together by each packet flow"""
+
+trafficSeeds = np.random.SeedSequence()
+"""Seed sequence from which the random stream of each new PacketFlow is spawned"""
+
+TRACE_DTYPE = np.dtype([('time','f8'),('slice','S32'),('dir','S2'),('ue','S8'),('size','f8')])
+"""Structured array data type of traffic traces. Size is the packet payload in bytes, without header"""
+
+trafficRecorder = None
+"""TrafficTrace where new packet flows record their arrivals, or None"""
+
+trafficReplay = None
+"""TrafficTrace from which new packet flows replay their arrivals instead of sampling them, or None"""
+
+def setTrafficTrace(recorder=None,replay=None):
+	"""
+		This method sets the traffic traces used by packet flows created afterwards. If recorder is not None,
+		all packet arrivals are recorded on it. If replay is not None, arrivals are taken from it.
+	"""
+	global trafficRecorder, trafficReplay
+	trafficRecorder = recorder
+	trafficReplay = replay
+
+def seedTrafficStreams(seed):
+	"""
+		This method sets the seed of the traffic random streams. Packet flows created afterwards get
+		independent streams spawned from it, so traffic is reproducible by seed and does not share
+		state with the global random generator.
+	"""
+	global trafficSeeds
+	trafficSeeds = np.random.SeedSequence(seed)
+
+
+class TruncParetoStream():
+	"""
+		This class draws samples from a Pareto distribution truncated to a maximum value.
+		Samples are drawn in blocks by the inverse CDF method, instead of rejecting values over the maximum.
+	"""
+	def __init__(self,rng,scale,maxValue):
+		self.rng = rng
+		self.scale = scale
+		self.maxValue = maxValue
+		self.block = []
+		self.index = 0
+		if maxValue > scale:
+			self.maxCdf = 1.0 - (float(scale)/maxValue)**PARETO_SHAPE
+		else:
+			self.maxCdf = 0.0
+
+	def drawBlock(self,n):
+		"""This method returns an array with n samples. The CDF is inverted over [0, maxCdf) to respect the maximum."""
+		u = self.rng.random(n)*self.maxCdf
+		return self.scale*(1.0 - u)**(-1.0/PARETO_SHAPE)
+
+	def next(self):
+		if self.index == len(self.block):
+			self.block = self.drawBlock(TRAFFIC_BLOCK_SIZE).tolist()
+			self.index = 0
+		value = self.block[self.index]
+		self.index = self.index + 1
+		return value
+
+
+class TrafficTrace():
+	"""
+		This class is used to record and replay packet arrivals (time, slice, direction, UE, size).
+		Traces are stored as .npy structured arrays of TRACE_DTYPE, which are memory mapped when loaded.
+		External CSV traces with time, ue and size columns, and optional slice and dir columns, can also be loaded.
+	"""
+	def __init__(self,arrivals=None):
+		self.arrivals = arrivals
+		"""Structured array with the trace arrivals sorted by time, None for a trace being recorded"""
+		self.records = []
+
+	def record(self,flow,t,size):
+		self.records.append((t,flow.sliceName,flow.type,flow.ue,size))
+
+	def save(self,path):
+		"""This method saves the recorded arrivals, sorted by time, as a .npy file."""
+		arr = np.array(self.records,dtype=TRACE_DTYPE)
+		np.save(path,arr[np.argsort(arr['time'],kind='stable')])
+
+	@classmethod
+	def load(cls,path):
+		"""This method loads a .npy trace (memory mapped) or a .csv trace."""
+		if path.endswith('.csv'):
+			return cls.fromCsv(path)
+		return cls(np.load(path,mmap_mode='r'))
+
+	@classmethod
+	def fromCsv(cls,path):
+		rows = []
+		with open(path,newline='') as f:
+			for row in csv.DictReader(f):
+				rows.append((float(row['time']),row.get('slice',''),row.get('dir',''),row['ue'],float(row['size'])))
+		arr = np.array(rows,dtype=TRACE_DTYPE)
+		return cls(arr[np.argsort(arr['time'],kind='stable')])
+
+	def flowArrivals(self,flow):
+		"""
+			This method returns the arrival times and sizes of the packet flow. Arrivals without slice
+			or direction match flows of any slice or direction.
+		"""
+		mask = self.arrivals['ue'] == flow.ue.encode()
+		mask &= (self.arrivals['slice'] == flow.sliceName.encode()) | (self.arrivals['slice'] == b'')
+		mask &= (self.arrivals['dir'] == flow.type.encode()) | (self.arrivals['dir'] == b'')
+		return self.arrivals['time'][mask].tolist(), self.arrivals['size'][mask].tolist()
+
 
 class PacketFlow():
 	"""
@@ -24,7 +137,21 @@ class PacketFlow():
 		self.sMax = (float(self.packetSize)/350)*600
 		self.tMax = (float(self.pckArrivalRate)/6)*12.5
 		self.tStart = 0
+		self.rng = np.random.default_rng(trafficSeeds.spawn(1)[0])
+		"""Random generator of the flow"""
+		self.sizeStream = TruncParetoStream(self.rng,self.packetSize*(0.2/1.2),self.sMax)
+		self.arrStream = TruncParetoStream(self.rng,self.pckArrivalRate*(0.2/1.2),self.tMax)
+		self.recorder = trafficRecorder
+		"""TrafficTrace where packet arrivals are recorded, or None"""
+		self.replay = trafficReplay.flowArrivals(self) if trafficReplay is not None else None
+		"""Tuple with the arrival times and sizes lists replayed from a trace, or None to sample them"""
+		self.replayIndex = 0
+		self.tLastArrival = None
+		self.nextArrival = None
+		"""Next (arrival time, payload size) tuple, already drawn but not stored in the application buffer yet"""
 		self.appBuff = PcktQueue()
+		self.appPcktEvent = None
+		"""Event triggered when a packet is stored in the application buffer"""
 		self.lostPackets = 0
 		self.sentPackets = 0
 		self.rcvdBytes = 0
@@ -33,38 +160,101 @@ class PacketFlow():
 		self.meassuredKPI = {'Throughput':0,'Delay':0,'PacketLossRate':0}
 
 
+	def setRng(self,rng):
+		"""This method replaces the flow random generator. Packet sizes and inter arrival times already drawn are discarded."""
+		self.rng = rng
+		self.sizeStream = TruncParetoStream(rng,self.sizeStream.scale,self.sizeStream.maxValue)
+		self.arrStream = TruncParetoStream(rng,self.arrStream.scale,self.arrStream.maxValue)
+
 	def setQosFId(self,q):
 		qosFlowId = q
 
 	def queueAppPckt(self,env,tSim): # --- PEM -----
 		"""
-			This method creates packets according to the packet flow traffic profile and stores them in 
-			the application buffer.
+			This method creates packets according to the packet flow traffic profile, or replays them
+			from a trace, and stores them in the application buffer.
+		"""
+		for t,size in self.arrivals(tSim):
+			if t > env.now:
+				yield env.timeout(t - env.now)
+			self.insertAppPckt(size,t)
+			if self.appPcktEvent is not None and not self.appPcktEvent.triggered:
+				self.appPcktEvent.succeed() # wake up UE bearer ingress
+
+	def insertAppPckt(self,size,t):
+		"""This method creates a packet of the given payload size arriving at time t and stores it in the application buffer."""
+		self.sentPackets = self.sentPackets + 1
+		pD = Packet(self.pId,size+self.header,self.qosFlowId,self.ue)
+		self.pId = self.pId + 1
+		pD.tIn = t
+		self.appBuff.insertPckt(pD)
+		self.nextArrival = None
+		if self.recorder is not None:
+			self.recorder.record(self,t,size)
+		return pD
+
+	def arrivals(self,tSim):
+		"""
+			This generator yields (arrival time, payload size) tuples in time order, following the flow traffic
+			profile or the replayed trace. Arrivals stop at 0.83*tSim.
+			The generator state is kept in the flow, so a new generator resumes from the next arrival
+			not stored in the application buffer yet (i.e. after a checkpoint restore).
+		"""
+		while True:
+			if self.nextArrival is None:
+				self.nextArrival = self.drawArrival(tSim)
+				if self.nextArrival is None:
+					return
+			yield self.nextArrival
+
+	def drawArrival(self,tSim):
+		"""This method returns the next (arrival time, payload size) tuple, or None if there are no more arrivals."""
+		if self.replay is not None:
+			if self.replayIndex == len(self.replay[0]) or self.replay[0][self.replayIndex]>=(tSim*0.83):
+				return None
+			self.replayIndex = self.replayIndex + 1
+			return self.replay[0][self.replayIndex-1], self.replay[1][self.replayIndex-1]
+		if self.tLastArrival is None:
+			t = self.tStart = self.rng.exponential(1.0) # each UE start transmission after tStart
+		else:
+			t = self.tLastArrival + self.getParrRate()
+		if t>=(tSim*0.83):
+			return None
+		self.tLastArrival = t
+		return t, self.getPsize()
+
+	def drawAllArrivals(self,tSim):
+		"""This method draws all the remaining arrivals of the flow and returns them as (times, sizes) lists."""
+		times = []
+		sizes = []
+		arrival = self.drawArrival(tSim)
+		while arrival is not None:
+			times.append(arrival[0])
+			sizes.append(arrival[1])
+			arrival = self.drawArrival(tSim)
+		return times, sizes
+
+	def setReplay(self,replay):
+		"""This method sets the (times, sizes) lists the flow replays from its next arrival on. Lists are not modified, so they can be shared."""
+		self.replay = replay
+		self.replayIndex = 0
+		self.nextArrival = None
+
+	def waitAppPckt(self,env):
+		"""
+			This method returns an event which is triggered when queueAppPckt stores the next packet
+			in the application buffer.
 		"""
-		ueN = int(self.ue[2:]) # number of UEs in simulation
-		self.tStart = (random.expovariate(1.0))
-		yield env.timeout(self.tStart) 	 # each UE start transmission after tStart
-		while env.now<(tSim*0.83):
-			self.sentPackets = self.sentPackets + 1
-			size = self.getPsize()
-			pD = Packet(self.pId,size+self.header,self.qosFlowId,self.ue)
-			self.pId = self.pId + 1
-			pD.tIn = env.now
-			self.appBuff.insertPckt(pD)
-			nextPackTime = self.getParrRate()
-			yield env.timeout(nextPackTime)
+		self.appPcktEvent = env.event()
+		return self.appPcktEvent
 
 	def getPsize(self):
-		pSize = random.paretovariate(1.2)*(self.packetSize*(0.2/1.2))
-		while pSize > self.sMax:
-			pSize = random.paretovariate(1.2)*(self.packetSize*(0.2/1.2))
+		pSize = self.sizeStream.next()
 		self.sMed = self.sMed + pSize
 		return pSize
 
 	def getParrRate(self):
-		pArrRate = random.paretovariate(1.2)*(self.pckArrivalRate*(0.2/1.2))
-		while pArrRate > self.tMax:
-			pArrRate = random.paretovariate(1.2)*(self.pckArrivalRate*(0.2/1.2))
+		pArrRate = self.arrStream.next()
 		self.tMed = self.tMed + pArrRate
 		return pArrRate
 
@@ -80,6 +270,8 @@ class Packet:
 	"""
 		This class is used to model packets properties and behabiour.
 	"""
+	__slots__ = ('secNum','size','qosFlowId','ue','tIn')
+
 	def __init__(self,sn,s,qfi,u):
 		self.secNum = sn
 		self.size = s
@@ -94,31 +286,107 @@ class Bearer:
 	"""
 		This class is used to model Bearers properties and behabiour.
 	"""
-	def __init__(self,i,q,tp):
+	__slots__ = ('id','qci','type','buffer')
+
+	def __init__(self,i,q,tp,totals=None):
 		self.id = i
 		self.qci = q
 		self.type = tp
-		self.buffer = PcktQueue()
+		self.buffer = PcktQueue(totals)
 	
 	def has_packets(self):
 		return not self.buffer.is_empty()
 
-class PcktQueue:
+class QueueTotals:
 	"""
-		This class is used to model application and bearer buffers.
+		This class is used to keep a running packet total of a set of buffers, like the bearer buffers of a slice.
 	"""
+	__slots__ = ('pckts',)
+
 	def __init__(self):
+		self.pckts = 0
+		"""Number of packets in the buffers"""
+
+	def update(self,n):
+		self.pckts = self.pckts + n
+
+class PcktQueue:
+	"""
+		This class is used to model application and bearer buffers. It keeps a running byte total, and
+		updates the packet total of the set of buffers it belongs to, if any.
+	"""
+	__slots__ = ('pckts','bytes','totals')
+
+	def __init__(self,totals=None):
 		self.pckts = deque([])
+		self.bytes = 0
+		"""Number of bytes in the buffer"""
+		self.totals = totals
+		"""QueueTotals of the set of buffers this buffer belongs to, None if it does not belong to any"""
 
 	def insertPckt(self,p):
 		self.pckts.append(p)
+		self.countPckt(1,p.size)
 
 	def insertPcktLeft(self,p):
 		self.pckts.appendleft(p)
+		self.countPckt(1,p.size)
 
 	def removePckt(self):
 		if len(self.pckts)>0:
-			return self.pckts.popleft()
+			p = self.pckts.popleft()
+			self.countPckt(-1,-p.size)
+			return p
+
+	def countPckt(self,n,size):
+		"""This method updates the totals when n packets of size bytes are inserted (or removed, with negative values)."""
+		if len(self.pckts)>0:
+			self.bytes = self.bytes + size
+		else:
+			self.bytes = 0 # Avoids accumulating rounding errors
+		if self.totals is not None:
+			self.totals.update(n)
 	
 	def is_empty(self):
 		return len(self.pckts) == 0
+
+class SegmentTracker:
+	"""
+		This class is used to track the segmentation of UE packets in TBs. It keeps the number of TB segments
+		of each packet not served yet, and the sequence number of the packet whose tail segment is still at the
+		head of the bearer buffer. As only the head packet of a bearer can be split, lookups are O(1).
+	"""
+	__slots__ = ('outstanding','tailSecNum')
+
+	def __init__(self):
+		self.outstanding = {}
+		"""Dictionary with the number of TB segments not served yet of each packet, by sequence number"""
+		self.tailSecNum = None
+		"""Sequence number of the packet whose tail segment is in the bearer buffer, None if there is not any"""
+
+	def segmentsQueued(self,secNums):
+		"""This method counts a new TB segment for each packet in secNums."""
+		for sn in secNums:
+			self.outstanding[sn] = self.outstanding.get(sn,0) + 1
+
+	def setTail(self,sn):
+		"""This method sets the packet whose tail segment was put back in the bearer buffer, or None if no packet was split."""
+		self.tailSecNum = sn
+
+	def segmentServed(self,sn):
+		"""
+			This method accounts a served TB segment of packet sn. It returns True when the packet is completed,
+			that is, when all its TB segments have been served and no part of it remains in the bearer buffer.
+		"""
+		n = self.outstanding[sn] - 1
+		if n == 0 and sn != self.tailSecNum:
+			del self.outstanding[sn]
+			return True
+		self.outstanding[sn] = n
+		return False
+
+	def pendingPckts(self):
+		"""This method returns the number of packets with TB segments not served yet and no part in the bearer buffer."""
+		if self.tailSecNum in self.outstanding:
+			return len(self.outstanding) - 1
+		return len(self.outstanding)
@@ -0,0 +1,135 @@
+"""
+    This module contains a sampling profiler for simulation runs.
+    A background thread samples the call stack of the simulation thread at a fixed interval. Samples are
+    attributed to simulator subsystems (traffic, ingress, intra slice, inter slice, statistics, debug
+    logging, plotting, ...) and exported as collapsed stacks, the input format of flamegraph tools.
+"""
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from utilities import Format
+
+SUBSYSTEM_RULES = [
+    ('plotting', lambda f, qn, n: 'matplotlib' in f or n.startswith('plot') or n.startswith('makePlots')),
+    ('debug logging', lambda f, qn, n: n.startswith('printDeb') or n.startswith('printQ') or n == 'printSliceConfig'),
+    ('stats', lambda f, qn, n: n in ('updateStsts', 'openStsts', 'getKPIs', 'getKPIsInter', 'getAvKPIs', 'printResults')),
+    ('traffic', lambda f, qn, n: f == 'packet.py' and qn.split('.')[0] in ('PacketFlow', 'TruncParetoStream', 'TrafficTrace')),
+    ('ingress', lambda f, qn, n: f == 'UE.py' and (n in ('receivePckt', 'moveAppPckt', 'moveAppPckts', 'queueDataPckt', 'connect') or qn.startswith('IngressClock.'))),
+    ('channel', lambda f, qn, n: f == 'channel.py' or n in ('pem_update_ue_group_rl', 'update_ue_group_rl', 'read_ues_channel_status')),
+    ('inter-slice', lambda f, qn, n: f in ('InterSliceSch.py', 'Scheds_Inter.py', 'Slice.py')),
+    ('intra-slice', lambda f, qn, n: f in ('IntraSliceSch.py', 'Scheds_Intra.py')),
+    ('engine', lambda f, qn, n: f == 'SlotClock.py' or os.sep + 'simpy' + os.sep in f),
+]
+"""
+    List of (subsystem, rule) tuples. A rule takes the file name (base name for simulator modules, full path otherwise),
+    the qualified name and the name of the function of a frame. Each sample is attributed to the subsystem of the
+    innermost frame matching a rule; rules are checked in order, so debug logging inside intra slice methods counts
+    as debug logging.
+"""
+
+OTHER_SUBSYSTEM = 'other'
+
+class SamplingProfiler:
+    """
+        Sampling profiler. Use start and stop around the profiled code, or the instance as a context manager.
+    """
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        """Sampling interval in seconds"""
+        self.samples = Counter()
+        """Counter of sampled stacks. Each stack is a tuple of (file, function) frames, outermost first"""
+        self.wallTime = 0.0
+        self.thread = None
+        self.running = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        """This method starts sampling the calling thread."""
+        self.targetId = threading.get_ident()
+        self.running = True
+        self.tStart = time.perf_counter()
+        self.thread = threading.Thread(target=self.sample, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        self.thread.join()
+        self.wallTime = self.wallTime + time.perf_counter() - self.tStart
+
+    def sample(self):
+        ownFile = __file__
+        while self.running:
+            time.sleep(self.interval)
+            frame = sys._current_frames().get(self.targetId)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename != ownFile:
+                    stack.append((frameFile(code.co_filename), getattr(code, 'co_qualname', code.co_name)))
+                frame = frame.f_back
+            if stack:
+                stack.reverse()
+                self.samples[tuple(stack)] += 1
+
+    def subsystems(self):
+        """This method returns a Counter with the number of samples attributed to each subsystem."""
+        bySubsystem = Counter()
+        for stack, count in self.samples.items():
+            bySubsystem[stackSubsystem(stack)] += count
+        return bySubsystem
+
+    def writeCollapsed(self, path):
+        """This method writes the samples as collapsed stacks: one 'frame;frame;... count' line by stack."""
+        with open(path, 'w') as f:
+            for stack, count in self.samples.most_common():
+                f.write(';'.join([fl + ':' + fn for fl, fn in stack]) + ' ' + str(count) + '\n')
+
+    def printReport(self):
+        """This method prints the wall time attributed to each subsystem on the terminal."""
+        bySubsystem = self.subsystems()
+        total = sum(bySubsystem.values())
+        print (Format.CBOLD+Format.CBLUE+'\nProfile: '+str(round(self.wallTime,2))+' s wall time, '+str(total)+' samples'+Format.CEND)
+        for subsystem, count in bySubsystem.most_common():
+            share = float(count)/total
+            print ('%-16s %8.2f s %6.1f %%' % (subsystem, share*self.wallTime, 100*share))
+
+simulatorDir = os.path.dirname(os.path.abspath(__file__))
+frameFiles = {}
+
+def frameFile(path):
+    """This method returns the base name of simulator modules, and the full path of other files."""
+    if path not in frameFiles:
+        if os.path.dirname(os.path.abspath(path)) == simulatorDir:
+            frameFiles[path] = os.path.basename(path)
+        else:
+            frameFiles[path] = path
+    return frameFiles[path]
+
+def stackSubsystem(stack):
+    """This method returns the subsystem of a sampled stack."""
+    for fl, fn in reversed(stack):
+        name = fn.split('.')[-1]
+        for subsystem, rule in SUBSYSTEM_RULES:
+            if rule(fl, fn, name):
+                return subsystem
+    return OTHER_SUBSYSTEM
+
+def profileCall(collapsedPath, func, *args, **kwargs):
+    """
+        This method calls func with the given arguments under a SamplingProfiler, prints the subsystems report,
+        writes the collapsed stacks to collapsedPath and returns the func result.
+    """
+    with SamplingProfiler() as profiler:
+        result = func(*args, **kwargs)
+    profiler.printReport()
+    profiler.writeCollapsed(collapsedPath)
+    print ('Collapsed stacks written to '+collapsedPath)
+    return result
@@ -0,0 +1,89 @@
+"""
+    This module contains the binary scheduler trace of the intra slice schedulers.
+    While the trace is enabled, each scheduler writes its TTI headers, bearer queue snapshots, resource allocations,
+    TB events and packet losses to Logs/<slice><dir>trace.bin as fixed size records, through a buffered file.
+    Records are much smaller and cheaper to write than the HTML debug log, and the tracerender script
+    renders a time or UE window of a trace to the HTML debug log look afterwards.
+"""
+import struct
+import numpy as np
+
+TRACE_MAGIC = b'PY5TRACE'
+"""First bytes of a scheduler trace file"""
+TRACE_VERSION = 1
+"""Version of the trace records layout"""
+
+HEADER = struct.Struct('<8sHd32s4s')
+"""Trace file header: magic, version, TTIs by ms, slice label and direction"""
+RECORD = struct.Struct('<qBBiqdd')
+"""Trace record: subframe number, kind, code, UE index, identifier and two values"""
+RECORD_DTYPE = np.dtype([('frame','<i8'),('kind','u1'),('code','u1'),('ue','<i4'),('id','<i8'),('v1','<f8'),('v2','<f8')])
+"""NumPy dtype of the trace records, for reading a whole trace at once"""
+
+TRACE_BUFFER_SIZE = 1 << 20
+"""Buffer size in bytes of the trace files"""
+
+TTI = 1
+"""TTI start. v1: time (ms), v2: scheduler PRBs"""
+QUEUE = 2
+"""Non empty bearer queue of a UE at TTI start. id: first packet, v1: packets, v2: bytes"""
+ALLOC = 3
+"""Resources allocated to a UE. v1: PRBs, v2: scheduler metric (PF factor, TDD symbols)"""
+TB_QUEUED = 4
+"""TB queued. id: TB, v1: bytes, v2: PRBs, code: one of TB_CODES"""
+TB_SERVED = 5
+"""TB served at the end of the TTI. id: TB, v1: time (ms), v2: bytes"""
+TB_LOST = 6
+"""TB lost at the end of the TTI, queued to retransmit. id: TB, v1: time (ms), code: retransmissions (up to 255)"""
+PACKET_SERVED = 7
+"""Last segment of a packet served. id: packet"""
+PACKET_LOST = 8
+"""Packet dropped at the bearer buffer. id: packet, v1: arrival time (ms)"""
+
+TB_CODES = {'data': 0, 'Sig': 1, 'reTx': 2}
+"""Code of each TB_QUEUED record type"""
+
+traceEnabled = False
+"""True if the schedulers created afterwards write a scheduler trace"""
+
+def setSchedTrace(enabled=False):
+    """This method sets if the schedulers created afterwards write a scheduler trace."""
+    global traceEnabled
+    traceEnabled = enabled
+
+def tracePath(sliceLabel, dir):
+    """This method returns the path of the trace file of the scheduler of sliceLabel slice in dir direction."""
+    return 'Logs/'+sliceLabel+dir+'trace.bin'
+
+class SchedTrace:
+    """
+        Scheduler trace writer. Records are packed and written to a file buffered with TRACE_BUFFER_SIZE bytes,
+        so the file object can be stored and restored by checkpoints like the other log files.
+    """
+    def __init__(self, path, ttiByms, sliceLabel, dir):
+        self.file = open(path, 'wb', buffering=TRACE_BUFFER_SIZE)
+        self.file.write(HEADER.pack(TRACE_MAGIC, TRACE_VERSION, ttiByms, sliceLabel.encode(), dir.encode()))
+
+    def record(self, kind, frame, ue=-1, id=0, v1=0.0, v2=0.0, code=0):
+        """This method writes a record. ue is the UE integer index, or -1 if the record is not about one UE."""
+        self.file.write(RECORD.pack(frame, kind, code, ue, id, v1, v2))
+
+    def close(self):
+        self.file.close()
+
+def readTrace(path):
+    """
+        This method reads the trace file path. It returns a dictionary with the header fields
+        (version, ttiByms, slice and dir) and the records as a RECORD_DTYPE array.
+    """
+    with open(path, 'rb') as f:
+        magic, version, ttiByms, sliceLabel, dir = HEADER.unpack(f.read(HEADER.size))
+        if magic != TRACE_MAGIC:
+            raise ValueError(path+' is not a scheduler trace file')
+        if version != TRACE_VERSION:
+            raise ValueError(path+' has trace version '+str(version)+', expected '+str(TRACE_VERSION))
+        data = f.read()
+    n = len(data)//RECORD_DTYPE.itemsize # A trace cut while writing may end with a partial record
+    records = np.frombuffer(data, dtype=RECORD_DTYPE, count=n)
+    header = {'version': version, 'ttiByms': ttiByms, 'slice': sliceLabel.rstrip(b'\0').decode(), 'dir': dir.rstrip(b'\0').decode()}
+    return header, records
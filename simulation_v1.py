@@ -2,12 +2,20 @@
     This is the simulation script for deepMIMO scenarios.
 """
 
+import argparse
 import simpy
 from UE import *
 from UE import UeGroupDeepMimo
 from Cell import CellDeepMimo
 from Results import *
 from utilities import Format
+from schedtrace import setSchedTrace
+from profiler import profileCall
+
+parser = argparse.ArgumentParser(description='Runs a simulation of the deepMIMO scenario.')
+parser.add_argument('--profile', action='store_true', help='profile the run and report the wall time by subsystem')
+parser.add_argument('--profile-out', default='profile.collapsed', help='collapsed stacks file for flamegraphs')
+args = parser.parse_args()
 
 DEEPMIMO_CONFIG_FILE = 'config.json'
 
@@ -43,6 +51,10 @@ debMode = True # to show queues information by TTI during simulation
 """Boolean indicating if debugging mode is active. In that case, an html log file will be generated with schedulers operation.
 Note that in simulations with a high number of UEs this file can turn quite heavy."""
 
+schedTrace = False # to write the binary scheduler trace during simulation
+"""Boolean indicating if the schedulers write a binary trace in Logs/<slice><dir>trace.bin, much lighter than the html log file.
+It can be rendered to html afterwards with the tracerender script."""
+
 measInterv = 100.0 # interval between meassures
 """Time interval (in milliseconds) between meassures for statistics reports."""
 
@@ -55,6 +67,7 @@ interSliceSchGr = 3000.0 # interSlice scheduler time granularity
 
 env = simpy.Environment()
 """Environment instance needed by simpy for runing PEM methods"""
+setSchedTrace(schedTrace)
 
 cell1 = CellDeepMimo(
     cell_id = 'c1',
@@ -143,7 +156,10 @@ for ueG in UEgroups:
     ueG.activateSliceScheds(interSliceSche1,env)
 
 #----------------------------------------------------------------
-env.run(until=simulation_duration)
+if args.profile:
+    profileCall(args.profile_out, env.run, until=simulation_duration)
+else:
+    env.run(until=simulation_duration)
 #----------------------------------------------------------------
 
 #      Closing statistic and debugging files
@@ -152,9 +168,11 @@ for slice in list(cell1.slicesStsts.keys()):
     cell1.slicesStsts[slice]['DL'].close()
     cell1.slicesStsts[slice]['UL'].close()
 for slice in list(interSliceSche1.slices.keys()):
-        interSliceSche1.slices[slice].schedulerDL.dbFile.close()
+        interSliceSche1.slices[slice].schedulerDL.closeIdleTTIs(env.now)
+        interSliceSche1.slices[slice].schedulerDL.closeLogs()
         if slice != 'LTE':
-            interSliceSche1.slices[slice].schedulerUL.dbFile.close()
+            interSliceSche1.slices[slice].schedulerUL.closeIdleTTIs(env.now)
+            interSliceSche1.slices[slice].schedulerUL.closeLogs()
         # Only for NUM scheduler results:
         interSliceSche1.slices[slice].schedulerDL.plot_assignation()
         interSliceSche1.slices[slice].schedulerUL.plot_assignation()
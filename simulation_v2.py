@@ -1,11 +1,27 @@
 """
     This is the simulation script for deepMIMO scenarios.
+    The simulation is available as the run_simulation(config, seed) function, so it can be called
+    from other scripts like the parameter sweep runner. Running this module executes DEFAULT_CONFIG.
 """
 
+import argparse
+import copy
+import os
+import random
+import numpy as np
 import simpy
 from UE import *
 from UE import UeGroupDeepMimo
 from Cell import CellDeepMimo
+from SlotClock import SlotClockEngine
+from packet import seedTrafficStreams, setTrafficTrace, TrafficTrace
+from IntraSliceSch import seedBlerStreams
+from debuglog import DebugFilter, setDebugFilter
+from schedtrace import setSchedTrace
+import IntraSliceSch
+import packet
+from checkpoint import saveCheckpoint, loadCheckpoint, resumeProcess
+from profiler import profileCall
 from Results import *
 from utilities import Format
 
@@ -15,156 +31,293 @@ DEEPMIMO_CONFIG_FILE = 'config.json'
 #              Cell & Simulation parameters
 #------------------------------------------------------------------------------------------------------
 
-scenario_dir = "scenarios/Escenario1/"
+DEFAULT_CONFIG = {
+    'cellId': 'c1',
+    'scenario_dir': "scenarios/Escenario1/",
+    'band': 'B1', # In TDD mode it is important to set correctly a band from the next list: n257, n258, n260, n261.
+    'tdd': False,
+    'buf': 81920, # Maximum Bytes the UE Bearer buffer can tolerate before dropping packets
+    'schedulerInter': 'Default',
+    'debMode': True, # to show queues information by TTI during simulation
+    'debugFilter': None, # DebugFilter arguments (level, slices, ues, tStart, tEnd) restricting the debug logs
+    'schedTrace': False, # to write the binary scheduler trace by TTI during simulation
+    'measInterv': 100.0, # interval between meassures (ms)
+    'interSliceSchGr': 6000.0, # interSlice scheduler time granularity (ms)
+    'slotClockMode': False, # slices and UE traffic driven by the slot clock engine instead of PEM methods
+    'recordTrace': None, # .npy file where packet arrivals are recorded
+    'replayTrace': None, # .npy or .csv file from which packet arrivals are replayed
+    'checkpointInterv': None, # interval between checkpoints (ms)
+    'checkpointDir': 'Checkpoints',
+    'UEgroups': [
+        { # 1.2Mbps each
+            'nuDL': 5,
+            'nuUL': 0,
+            'pszDL': 15000,  # bytes
+            'pszUL': 0,  # bytes
+            'parrDL': 100,  # miliseconds between packets
+            'parrUL': 0,  # miliseconds between packets
+            'label': 'eMBB-lejos',
+            'dly': 100,  # milisecond
+            'avlty': '',
+            'schedulerType': 'NUM',  # 'DF'
+            'mmMd': 'MU',  # For NUM inter slice schedulerMIMO mode must be 'MU'
+            'lyrs': 0,  # Dont apply for NUM inter slice scheduler
+        },
+        { # 4Mbps each
+            'nuDL': 5,
+            'nuUL': 0,
+            'pszDL': 50000,  # bytes
+            'pszUL': 0,  # bytes
+            'parrDL': 100,  # miliseconds between packets
+            'parrUL': 0,  # miliseconds between packets
+            'label': 'eMMB-cerca',
+            'dly': 100,  # milisecond
+            'avlty': '',
+            'schedulerType': 'NUM',  # 'DF'
+            'mmMd': 'MU',  # For NUM inter slice schedulerMIMO mode must be 'MU'
+            'lyrs': 0,  # Dont apply for NUM inter slice scheduler
+        },
+    ],
+}
+"""
+    Dictionary with the default simulation configuration. Keys are:\n
+    cellId: string with the cell identifier.\n
+    scenario_dir: directory with the DeepMIMO scenario (config.json and one UEgroup_<i> directory by UE group).\n
+    band: string with used band for simulation.\n
+    tdd: boolean indicating if the cell operates in TDD mode.\n
+    buf: integer with the maximum Bytes the UE Bearer buffer can tolerate before dropping packets.\n
+    schedulerInter: string indicating the Inter Slice Scheduler to use.\n
+    debMode: boolean indicating if debugging mode is active. In that case, an html log file will be generated with schedulers operation.
+    Note that in simulations with a high number of UEs this file can turn quite heavy.\n
+    debugFilter: dictionary with the debuglog.DebugFilter arguments (level, slices, ues, tStart, tEnd), to log only some
+    slices, UEs or a simulation time window in debugging mode, or None to log everything.\n
+    schedTrace: boolean indicating if the schedulers write a binary trace in Logs/<slice><dir>trace.bin. It is much lighter than
+    the html log file, and a time or UE window of it can be rendered to html afterwards with the tracerender script.\n
+    measInterv: time interval (in milliseconds) between meassures for statistics reports.\n
+    interSliceSchGr: inter slice scheduler time granularity in milliseconds.\n
+    slotClockMode: boolean indicating if slices and UE traffic are driven by the slot clock engine instead of PEM methods.\n
+    recordTrace: path of the .npy traffic trace where all packet arrivals are recorded, or None.\n
+    replayTrace: path of a .npy or .csv traffic trace from which packet arrivals are replayed instead of sampled, or None.\n
+    checkpointInterv: time interval (in milliseconds) between checkpoints of the simulation state, or None.
+    Checkpoints need the slot clock engine, so it is used when this key is set.\n
+    checkpointDir: directory where checkpoint_<time>.pkl files are stored.\n
+    UEgroups: list of dictionaries with the UeGroupDeepMimo traffic profile parameters. The i-th group reads its channel from UEgroup_<i>.
+"""
+
+#-----------------------------------------------------------------
+#              Simulation process activation
+#-----------------------------------------------------------------
 
-deep_mimo_parameters = CellDeepMimo.json_to_dict_config(scenario_dir + DEEPMIMO_CONFIG_FILE)
+def run_simulation(config, seed=None, verbose=False, channelStores=None):
+    """
+        This method runs a simulation with the given configuration (see DEFAULT_CONFIG) and returns
+        a list of dictionaries with the KPI of each slice and direction.
+        If seed is not None, random generators and traffic streams are seeded with it. In verbose mode results are printed
+        on the terminal and kpi plots are built, as in a single run. Logs, Statistics and Figures
+        directories are created in the current working directory.
+        channelStores is an optional list with the ChannelStateStore of each UE group. If it is None,
+        the channel status is read from the scenario files.
+    """
+    env, sim = build_simulation(config, seed, channelStores)
+    return simulate(env, sim, verbose)
 
-cant_prbs_base = deep_mimo_parameters.get('cant_prb')
-frequency_range = deep_mimo_parameters.get('frecuency_range')
-bandwidth = deep_mimo_parameters.get('bandwidth')
-is_dynamic = deep_mimo_parameters.get('is_dynamic')
-scene_duration = deep_mimo_parameters.get('refresh_rate')
-simulation_duration = deep_mimo_parameters.get('sim_duration')
+def build_simulation(config, seed=None, channelStores=None):
+    """
+        This method creates the SimPy environment, the cell, slices and UE groups of a simulation, and
+        activates their PEM methods. It returns the environment and a dictionary with the simulation objects.
+        Logs and Statistics files are opened in the current working directory.
+    """
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+        seedTrafficStreams(seed)
+        seedBlerStreams(seed)
 
+    scenario_dir = config['scenario_dir']
+    deep_mimo_parameters = CellDeepMimo.json_to_dict_config(scenario_dir + DEEPMIMO_CONFIG_FILE)
+    simulation_duration = deep_mimo_parameters.get('sim_duration')
+    measInterv = config['measInterv']
 
-band = 'B1'
-"""String with used band for simulation. In TDD mode it is important to set correctly a band from the next list: n257, n258, n260, n261."""
+    env = simpy.Environment()
+    setDebugFilter(DebugFilter(**config['debugFilter']) if config.get('debugFilter') else None)
+    setSchedTrace(config.get('schedTrace', False))
 
-tdd = False
-"""Boolean indicating if the cell operates in TDD mode."""
+    cell1 = CellDeepMimo(
+        cell_id = config.get('cellId', 'c1'),
+        bandwidth = deep_mimo_parameters.get('bandwidth'),
+        frequency_range = deep_mimo_parameters.get('frecuency_range'),
+        debug_mode = config['debMode'],
+        bearer_buffer_size = config['buf'],
+        tdd = config['tdd'],
+        granularity = config['interSliceSchGr'],
+        schInter = config['schedulerInter'],
+        cant_prbs_base = deep_mimo_parameters.get('cant_prb')
+    )
+    interSliceSche1 = cell1.interSliceSched
 
-buf = 81920
-"""Integer with the maximum Bytes the UE Bearer buffer can tolerate before dropping packets."""
+    # The slot clock engine and traffic traces must be set before the UE groups are created
+    engine = SlotClockEngine(env,cell1) if config.get('slotClockMode') or config.get('checkpointInterv') else None
+    recorder = TrafficTrace() if config.get('recordTrace') else None
+    replay = TrafficTrace.load(config['replayTrace']) if config.get('replayTrace') else None
+    setTrafficTrace(recorder, replay)
 
-schedulerInter = 'Default'
-"""String indicating the Inter Slice Scheduler to use."""
+    UEgroups = []
+    for i, ueGroupConfig in enumerate(config['UEgroups']):
+        UEgroups.append(UeGroupDeepMimo(
+            cell = cell1,
+            t_sim = simulation_duration,
+            measInterv = measInterv,
+            env = env,
+            ueg_dir = scenario_dir + 'UEgroup_' + str(i),
+            is_dynamic = deep_mimo_parameters.get('is_dynamic'),
+            scene_duration = deep_mimo_parameters.get('refresh_rate'),
+            channel_store = channelStores[i] if channelStores is not None else None,
+            **ueGroupConfig
+        ))
 
-debMode = True # to show queues information by TTI during simulation
-"""Boolean indicating if debugging mode is active. In that case, an html log file will be generated with schedulers operation.
-Note that in simulations with a high number of UEs this file can turn quite heavy."""
+    setTrafficTrace()
 
-measInterv = 100.0 # interval between meassures
-"""Time interval (in milliseconds) between meassures for statistics reports."""
+    for ueG in UEgroups:
+        interSliceSche1.createSlice(
+            ueG.req['reqDelay'],
+            ueG.req['reqThroughputDL'],
+            ueG.req['reqThroughputUL'],
+            ueG.req['reqAvailability'],
+            ueG.num_usersDL,
+            ueG.num_usersUL,
+            config['band'],
+            config['debMode'],
+            ueG.mmMd,
+            ueG.lyrs,
+            ueG.label,
+            ueG.sch
+        )
+    cell1.openStsts()
 
-interSliceSchGr = 6000.0 # interSlice scheduler time granularity
-"""Inter slice scheduler time granularity in milliseconds."""
+    procCell = env.process(cell1.updateStsts(env,interv=measInterv,tSim=simulation_duration))
+    procInter = env.process(interSliceSche1.resAlloc(env))
+    for ueG in UEgroups:
+        ueG.activateSliceScheds(interSliceSche1,env)
 
-#-----------------------------------------------------------------
-#              Simulation process activation
-#-----------------------------------------------------------------
+    sim = {
+        'config': config,
+        'cell': cell1,
+        'UEgroups': UEgroups,
+        'engine': engine,
+        'recorder': recorder,
+        'duration': simulation_duration,
+        'bandwidth': deep_mimo_parameters.get('bandwidth'),
+    }
+    return env, sim
 
-env = simpy.Environment()
-"""Environment instance needed by simpy for runing PEM methods"""
-
-cell1 = CellDeepMimo(
-    cell_id = 'c1',
-    bandwidth = bandwidth,
-    frequency_range = frequency_range,
-    debug_mode = debMode,
-    bearer_buffer_size = buf,
-    tdd = tdd,
-    granularity = interSliceSchGr,
-    schInter = schedulerInter,
-    cant_prbs_base = cant_prbs_base
-)
-"""Cell instance for running the simulation"""
-
-interSliceSche1 = cell1.interSliceSched
-"""interSliceScheduler instance"""
-
-UEgroup0 = UeGroupDeepMimo(  # 1.2Mbps each
-    nuDL = 5,
-    nuUL = 0,
-    pszDL = 15000,  # bytes
-    pszUL = 0,  # bytes
-    parrDL = 100,  # miliseconds between packets
-    parrUL = 0,  # miliseconds between packets
-    label = 'eMBB-lejos',
-    dly = 100,  # milisecond
-    avlty = '',
-    schedulerType = 'NUM',  # 'DF'
-    mmMd = 'MU',  # For NUM inter slice schedulerMIMO mode must be 'MU'
-    lyrs = 0,  # Dont apply for NUM inter slice scheduler
-    cell = cell1,
-    t_sim = simulation_duration,
-    measInterv = measInterv,
-    env = env,
-    ueg_dir = scenario_dir + 'UEgroup_0',
-    is_dynamic = is_dynamic,
-    scene_duration = scene_duration
-)
-"""Group of users with defined traffic profile for which the sumulation will run."""
-
-UEgroup1 = UeGroupDeepMimo(  # 4Mbps each
-    nuDL = 5,
-    nuUL = 0,
-    pszDL = 50000,  # bytes
-    pszUL = 0,  # bytes
-    parrDL = 100,  # miliseconds between packets
-    parrUL = 0,  # miliseconds between packets
-    label = 'eMMB-cerca',
-    dly = 100,  # milisecond
-    avlty = '',
-    schedulerType = 'NUM',  # 'DF'
-    mmMd = 'MU',  # For NUM inter slice schedulerMIMO mode must be 'MU'
-    lyrs = 0,  # Dont apply for NUM inter slice scheduler
-    cell = cell1,
-    t_sim = simulation_duration,
-    measInterv = measInterv,
-    env = env,
-    ueg_dir = scenario_dir + 'UEgroup_1',
-    is_dynamic = is_dynamic,
-    scene_duration = scene_duration
-)
-"""Group of users with defined traffic profile for which the sumulation will run."""
-
-UEgroups = [UEgroup0, UEgroup1]
-"""UE group list for the configured simulation"""
-
-for ueG in UEgroups:
-    interSliceSche1.createSlice(
-        ueG.req['reqDelay'],
-        ueG.req['reqThroughputDL'],
-        ueG.req['reqThroughputUL'],
-        ueG.req['reqAvailability'],
-        ueG.num_usersDL,
-        ueG.num_usersUL,
-        band,
-        debMode,
-        ueG.mmMd,
-        ueG.lyrs,
-        ueG.label,
-        ueG.sch
-    )
+def restore_simulation(path, seed=None, verbose=False, **configOverrides):
+    """
+        This method restores a simulation from a checkpoint file and runs it until the end, returning its KPI
+        as run_simulation. SimPy PEM methods are started again at the checkpoint time.
+        If seed is not None, random generators and traffic streams are seeded again with it, so several experiments
+        can be branched from the same checkpoint. configOverrides keys update the run configuration, e.g.
+        checkpointInterv or recordTrace. Logs and Statistics files are continued in the current working directory.
+    """
+    sim = loadCheckpoint(path)
+    sim['config'].update(configOverrides)
+    cell1 = sim['cell']
+    engine = sim['engine']
+    if seed is not None:
+        random.seed(seed)
+        np.random.seed(seed)
+        seedTrafficStreams(seed)
+        seedBlerStreams(seed)
+        for user in engine.users:
+            user.packetFlows[0].setRng(np.random.default_rng(packet.trafficSeeds.spawn(1)[0]))
+        for sch in engine.schedulers:
+            sch.blerRng = np.random.default_rng(IntraSliceSch.blerSeeds.spawn(1)[0])
+
+    env = simpy.Environment(initial_time=sim['time'])
+    engine.env = env
+    procCell = env.process(cell1.updateStsts(env,interv=sim['config']['measInterv'],tSim=sim['duration']))
+    procInter = env.process(resumeProcess(env,cell1.interSliceSched.granularity,cell1.interSliceSched.resAlloc(env)))
+    for ueG in sim['UEgroups']:
+        if ueG.is_dynamic:
+            env.process(ueG.pem_update_ue_group_rl(env,sim['duration']))
+    return simulate(env, sim, verbose)
+
+def simulate(env, sim, verbose):
+    """
+        This method runs the simulation built by build_simulation or restored by restore_simulation,
+        and returns the KPI of each slice and direction.
+    """
+    config = sim['config']
+    engine = sim['engine']
+    simulation_duration = sim['duration']
+
+    def checkpoint(t):
+        saveCheckpoint(os.path.join(config['checkpointDir'], 'checkpoint_%g.pkl' % t), dict(sim, time=t))
+
+    #----------------------------------------------------------------
+    if engine is not None:
+        engine.run(until=simulation_duration,checkpointInterv=config.get('checkpointInterv'),checkpoint=checkpoint)
+    else:
+        env.run(until=simulation_duration)
+    #----------------------------------------------------------------
+    return finish_simulation(sim, verbose)
+
+def finish_simulation(sim, verbose):
+    """
+        This method closes statistics and debugging files of a finished simulation and returns the KPI
+        of each slice and direction. In verbose mode results are also printed and plotted.
+    """
+    config = sim['config']
+    cell1 = sim['cell']
+    interSliceSche1 = cell1.interSliceSched
+    UEgroups = sim['UEgroups']
+    recorder = sim['recorder']
+    simulation_duration = sim['duration']
+    measInterv = config['measInterv']
+
+    #      Closing statistic and debugging files
+
+    if recorder is not None:
+        recorder.save(config['recordTrace'])
+
+    for slice in list(cell1.slicesStsts.keys()):
+        cell1.slicesStsts[slice]['DL'].close()
+        cell1.slicesStsts[slice]['UL'].close()
+    for slice in list(interSliceSche1.slices.keys()):
+            interSliceSche1.slices[slice].schedulerDL.closeIdleTTIs(simulation_duration)
+            interSliceSche1.slices[slice].schedulerDL.closeLogs()
+            if slice != 'LTE':
+                interSliceSche1.slices[slice].schedulerUL.closeIdleTTIs(simulation_duration)
+                interSliceSche1.slices[slice].schedulerUL.closeLogs()
+            if verbose:
+                # Only for NUM scheduler results:
+                interSliceSche1.slices[slice].schedulerDL.plot_assignation()
+
+    kpis = []
+    for UEg in UEgroups:
+        kpis.extend(UEg.getSliceKPIs(interSliceSche1,simulation_duration))
+
+    #----------------------------------------------------------------
+    #                          RESULTS
+    #----------------------------------------------------------------
+    # Show average PLR and Throughput in any case simulation and plots
+    if verbose:
+        for UEg in UEgroups:
+            print (Format.CBOLD+Format.CBLUE+'\n--------------------------------------------------'+Format.CEND)
+            print (Format.CBOLD+Format.CBLUE+'                 SLICE: '+UEg.label+'                  '+Format.CEND)
+            print (Format.CBOLD+Format.CBLUE+'--------------------------------------------------\n'+Format.CEND)
+            UEg.printSliceResults(interSliceSche1,simulation_duration,[sim['bandwidth']],measInterv)
+        print (Format.CBOLD+Format.CBLUE+'\n--------------------------------------------------'+Format.CEND)
+
+    return kpis
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs a simulation with DEFAULT_CONFIG.')
+    parser.add_argument('--profile', action='store_true', help='profile the run and report the wall time by subsystem')
+    parser.add_argument('--profile-out', default='profile.collapsed', help='collapsed stacks file for flamegraphs')
+    args = parser.parse_args()
 
-procCell = env.process(cell1.updateStsts(env,interv=measInterv,tSim=simulation_duration))
-procInter = env.process(interSliceSche1.resAlloc(env))
-for ueG in UEgroups:
-    ueG.activateSliceScheds(interSliceSche1,env)
-
-#----------------------------------------------------------------
-env.run(until=simulation_duration)
-#----------------------------------------------------------------
-
-#      Closing statistic and debugging files
-
-for slice in list(cell1.slicesStsts.keys()):
-    cell1.slicesStsts[slice]['DL'].close()
-    cell1.slicesStsts[slice]['UL'].close()
-for slice in list(interSliceSche1.slices.keys()):
-        interSliceSche1.slices[slice].schedulerDL.dbFile.close()
-        if slice != 'LTE':
-            interSliceSche1.slices[slice].schedulerUL.dbFile.close()
-        # Only for NUM scheduler results:
-        interSliceSche1.slices[slice].schedulerDL.plot_assignation()
-
-#----------------------------------------------------------------
-#                          RESULTS
-#----------------------------------------------------------------
-# Show average PLR and Throughput in any case simulation and plots
-for UEg in UEgroups:
-    print (Format.CBOLD+Format.CBLUE+'\n--------------------------------------------------'+Format.CEND)
-    print (Format.CBOLD+Format.CBLUE+'                 SLICE: '+UEg.label+'                  '+Format.CEND)
-    print (Format.CBOLD+Format.CBLUE+'--------------------------------------------------\n'+Format.CEND)
-    UEg.printSliceResults(interSliceSche1,simulation_duration,[bandwidth],measInterv)
-print (Format.CBOLD+Format.CBLUE+'\n--------------------------------------------------'+Format.CEND)
\ No newline at end of file
+    if args.profile:
+        profileCall(args.profile_out, run_simulation, copy.deepcopy(DEFAULT_CONFIG), verbose=True)
+    else:
+        run_simulation(copy.deepcopy(DEFAULT_CONFIG), verbose=True)
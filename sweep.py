@@ -0,0 +1,121 @@
+"""
+    This is the parameter sweep script for deepMIMO scenarios.
+    It runs simulation_v2.run_simulation for every combination of a parameters grid and a list of seeds,
+    distributing the runs across a process pool. Each run works in its own directory, with isolated
+    Logs, Statistics and Figures directories, and the KPI of all runs are merged in a summary table.
+"""
+
+import argparse
+import copy
+import csv
+import contextlib
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+matplotlib.use('Agg')
+from simulation_v2 import run_simulation, DEFAULT_CONFIG
+
+DEFAULT_GRID = {
+    'schedulerType': ['NUM', 'DF'],
+    'nuDL': [2, 5],
+    'pszDL': [15000, 50000],
+    'buf': [40960, 81920],
+}
+"""
+    Dictionary with the default parameters grid. Each key maps to the list of values to sweep.
+    Keys of the simulation configuration (see simulation_v2.DEFAULT_CONFIG) set that configuration value,
+    and any other key is taken as a UE group parameter and it is set on every UE group.
+"""
+
+KPI_FIELDS = ['slice', 'scheduler', 'dir', 'users', 'sentPackets', 'lostPackets', 'PLR', 'Throughput', 'MCS', 'PRBs', 'Numerology']
+"""List with the KPI columns of the summary table."""
+
+def makeConfig(baseConfig, point):
+    """This method returns a copy of baseConfig with the values of the grid point applied."""
+    config = copy.deepcopy(baseConfig)
+    for key, value in point.items():
+        if key in config:
+            config[key] = value
+        else:
+            for ueGroupConfig in config['UEgroups']:
+                ueGroupConfig[key] = value
+    return config
+
+def expandGrid(baseConfig, grid, seeds):
+    """This method returns the list of runs, as (runId, point, config, seed) tuples, for every grid point and seed."""
+    runs = []
+    keys = list(grid.keys())
+    for values in itertools.product(*[grid[k] for k in keys]):
+        point = dict(zip(keys, values))
+        config = makeConfig(baseConfig, point)
+        for seed in seeds:
+            runs.append((len(runs), point, config, seed))
+    return runs
+
+def runInDir(runDir, config, seed, **kwargs):
+    """
+        This method runs a simulation inside runDir, with its own Logs, Statistics and Figures directories,
+        and returns its KPI. Terminal output of the run is stored in the run.log file.
+    """
+    for d in ['Logs', 'Statistics', 'Figures']:
+        os.makedirs(os.path.join(runDir, d), exist_ok=True)
+    cwd = os.getcwd()
+    os.chdir(runDir)
+    try:
+        with open('run.log', 'w') as log, contextlib.redirect_stdout(log):
+            return run_simulation(config, seed, **kwargs)
+    finally:
+        os.chdir(cwd)
+
+def runPoint(run, outDir):
+    """
+        This method runs a single simulation in its own run directory and returns its KPI rows.
+        It is executed by the pool workers.
+    """
+    runId, point, config, seed = run
+    kpis = runInDir(os.path.join(outDir, 'run_%04d' % runId), config, seed)
+    rows = []
+    for kpi in kpis:
+        row = {'runId': runId, 'seed': seed}
+        row.update(point)
+        row.update(kpi)
+        rows.append(row)
+    return rows
+
+def sweep(baseConfig, grid, seeds, outDir='Sweep', workers=None):
+    """
+        This method runs the simulation for every grid point and seed across a pool of workers processes.
+        The merged KPI table is written to outDir/summary.csv and it is also returned as a list of dictionaries.
+    """
+    outDir = os.path.abspath(outDir)
+    os.makedirs(outDir, exist_ok=True)
+    baseConfig = copy.deepcopy(baseConfig)
+    # Runs are executed inside their own directories
+    baseConfig['scenario_dir'] = os.path.abspath(baseConfig['scenario_dir']) + os.sep
+    runs = expandGrid(baseConfig, grid, seeds)
+
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for runRows in pool.map(runPoint, runs, itertools.repeat(outDir)):
+            rows.extend(runRows)
+
+    fields = ['runId', 'seed'] + list(grid.keys()) + KPI_FIELDS
+    with open(os.path.join(outDir, 'summary.csv'), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fields, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Runs a parameter sweep of simulation_v2 over DEFAULT_GRID.')
+    parser.add_argument('--seeds', type=int, default=3, help='number of seeds by grid point')
+    parser.add_argument('--workers', type=int, default=None, help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--out', default='Sweep', help='output directory for run directories and summary.csv')
+    args = parser.parse_args()
+
+    baseConfig = copy.deepcopy(DEFAULT_CONFIG)
+    baseConfig['debMode'] = False
+    rows = sweep(baseConfig, DEFAULT_GRID, range(args.seeds), args.out, args.workers)
+    print('%d KPI rows written to %s' % (len(rows), os.path.join(args.out, 'summary.csv')))
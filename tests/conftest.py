@@ -0,0 +1,7 @@
+"""
+    Pytest configuration: the simulator modules are at the repository root.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
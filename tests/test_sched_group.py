@@ -0,0 +1,64 @@
+"""
+    This module checks the NUM scheduler group search on the compatibility graph against brute force enumeration.
+"""
+from itertools import combinations
+
+import numpy as np
+import pytest
+
+from Scheds_Intra import NUM_Scheduler, THRESHOLD_ANGLE
+
+
+def groupSearcher(method, maxGroupSize):
+    """This method returns a NUM scheduler with only the attributes used by search_sched_group."""
+    sch = NUM_Scheduler.__new__(NUM_Scheduler)
+    sch.groupSearch = method
+    sch.maxGroupSize = maxGroupSize
+    return sch
+
+def isClique(members, compatible):
+    """This method returns True if all the members are pairwise compatible."""
+    return all(compatible[i, j] for i, j in combinations(members, 2))
+
+def bruteForceWeight(weights, compatible, maxGroupSize):
+    """This method returns the weight of the heaviest clique of up to maxGroupSize UEs, enumerating all of them."""
+    best = -np.inf
+    for size in range(1, min(len(weights), maxGroupSize)+1):
+        for group in combinations(range(len(weights)), size):
+            if isClique(group, compatible):
+                best = max(best, weights[list(group)].sum())
+    return best
+
+def randomCase(rng):
+    """This method returns random UE weights and the compatibility graph of random UE angles."""
+    nUEs = rng.integers(1, 11)
+    degrees = rng.uniform(0, 6*THRESHOLD_ANGLE, nUEs)
+    weights = rng.uniform(0, 10, nUEs)
+    weights[rng.random(nUEs) < 0.2] = 0.0
+    compatible = np.abs(degrees[:, None] - degrees[None, :]) > THRESHOLD_ANGLE
+    return weights, compatible
+
+
+@pytest.mark.parametrize('maxGroupSize', [1, 2, 3, 8])
+def test_bnb_matches_brute_force(maxGroupSize):
+    rng = np.random.default_rng(maxGroupSize)
+    sch = groupSearcher('bnb', maxGroupSize)
+    for _ in range(300):
+        weights, compatible = randomCase(rng)
+        members = sch.search_sched_group(weights, compatible)
+        assert list(members) == sorted(members)
+        assert 1 <= len(members) <= maxGroupSize
+        assert isClique(members, compatible)
+        assert weights[members].sum() == pytest.approx(bruteForceWeight(weights, compatible, maxGroupSize))
+
+@pytest.mark.parametrize('maxGroupSize', [1, 2, 3, 8])
+def test_greedy_is_a_valid_group(maxGroupSize):
+    rng = np.random.default_rng(100 + maxGroupSize)
+    sch = groupSearcher('greedy', maxGroupSize)
+    for _ in range(300):
+        weights, compatible = randomCase(rng)
+        members = sch.search_sched_group(weights, compatible)
+        assert list(members) == sorted(members)
+        assert 1 <= len(members) <= maxGroupSize
+        assert isClique(members, compatible)
+        assert weights[members].sum() <= bruteForceWeight(weights, compatible, maxGroupSize) + 1e-9
@@ -0,0 +1,72 @@
+"""
+    This module checks the past TBS windows of UeStateStore against the deques they replace.
+"""
+from collections import deque
+
+import numpy as np
+import pytest
+
+from uestate import UeStateStore, PastTbszRing, pastTbszProperty
+
+
+class Ue:
+    """Minimal UE with a past TBS window, kept in a deque until it is attached to a store."""
+    pastTbsz = pastTbszProperty()
+
+    def __init__(self):
+        self.stateStore = None
+        self.pastTbsz = deque([1])
+
+def pushDeque(window, past, value):
+    """This method appends value to the past deque, dropping the oldest value first if it is full."""
+    if len(past) == window:
+        past.popleft()
+    past.append(value)
+
+def checkWindows(store, ues, refs):
+    """This method asserts that the past TBS window of each UE in the store matches its reference deque."""
+    means = store.pastMean()
+    for ue, ref in zip(ues, refs):
+        assert isinstance(ue.pastTbsz, PastTbszRing)
+        assert len(ue.pastTbsz) == len(ref)
+        assert list(ue.pastTbsz) == list(ref)
+        assert means[ue.stateRow] == pytest.approx(np.mean(ref))
+
+
+@pytest.mark.parametrize('window', [1, 2, 5, 31])
+def test_push_matches_deque(window):
+    rng = np.random.default_rng(window)
+    store = UeStateStore(window=window, capacity=2)
+    ues = [Ue() for _ in range(5)]
+    refs = [deque([1]) for _ in ues]
+    for ue in ues:
+        store.attach(ue)
+    checkWindows(store, ues, refs)
+    for _ in range(3*window + 10):
+        rows = np.flatnonzero(rng.random(len(ues)) < 0.7)
+        values = rng.integers(0, 10000, len(rows)).astype(float)
+        store.pushPastTbsz(rows, values)
+        for row, value in zip(rows, values):
+            pushDeque(window, refs[row], value)
+        checkWindows(store, ues, refs)
+
+def test_push_matches_ring_append():
+    rng = np.random.default_rng(0)
+    window = 4
+    store = UeStateStore(window=window)
+    ues = [Ue() for _ in range(3)]
+    refs = [deque([1]) for _ in ues]
+    for ue in ues:
+        store.attach(ue)
+    for step in range(40):
+        value = float(rng.integers(0, 10000))
+        row = step % len(ues)
+        if step % 2:
+            store.pushPastTbsz(np.array([row]), np.array([value]))
+        else:
+            past = ues[row].pastTbsz
+            if len(past) == window:
+                past.popleft()
+            past.append(value)
+        pushDeque(window, refs[row], value)
+        checkWindows(store, ues, refs)
@@ -0,0 +1,108 @@
+"""
+    This is the offline renderer of the binary scheduler traces (see schedtrace module).
+    It writes a time and UE window of a Logs/<slice><dir>trace.bin file as html, with the look
+    of the scheduler debug log. The window is selected on the whole trace with array operations,
+    so only the rendered records are formatted.
+"""
+
+import argparse
+import numpy as np
+from schedtrace import readTrace, TTI, QUEUE, ALLOC, TB_QUEUED, TB_SERVED, TB_LOST, PACKET_SERVED, PACKET_LOST, TB_CODES
+
+TB_TYPES = {code: type for type, code in TB_CODES.items()}
+"""TB type by TB_QUEUED record code"""
+
+SECTIONS = {QUEUE: 'queues', ALLOC: 'alloc', TB_QUEUED: 'tbs', TB_SERVED: 'served', TB_LOST: 'served', PACKET_SERVED: 'served'}
+"""Debug log section of each record kind. TTI and PACKET_LOST records are written out of sections"""
+
+def selectRecords(header, records, tStart=None, tEnd=None, ues=None):
+    """
+        This method returns the records of TTIs starting in the [tStart, tEnd) window (in ms), restricted to the UEs
+        in the ues list of integer indexes and the records without UE. None means no restriction.
+    """
+    mask = np.ones(len(records), dtype=bool)
+    t = records['frame']/header['ttiByms']
+    if tStart is not None:
+        mask &= t >= tStart - 1e-9
+    if tEnd is not None:
+        mask &= t < tEnd - 1e-9
+    if ues is not None:
+        mask &= (records['ue'] < 0) | np.isin(records['ue'], ues)
+    return records[mask]
+
+def ueName(ue):
+    """This method returns the UE identifier of the ue integer index of a record."""
+    return 'ue'+str(ue) if ue >= 0 else 'Broadcast'
+
+def renderRecords(f, records):
+    """This method writes the records to the html file f, grouped in the debug log sections of each TTI."""
+    section = None
+    prbs = 0
+    for frame, kind, code, ue, id, v1, v2 in zip(*[records[name].tolist() for name in records.dtype.names]):
+        newSection = SECTIONS.get(kind)
+        if kind != PACKET_LOST and newSection != section:
+            if section == 'queues':
+                f.write('<hr>')
+            elif section == 'alloc':
+                f.write('+++++++++++++++++++++++++++++++++++'+'<br>')
+            if newSection == 'alloc':
+                f.write('+++++++++++ Res Alloc +++++++++++++'+'<br>')
+                f.write('PRBs: '+str(int(prbs))+'<br>')
+            elif newSection == 'tbs':
+                f.write('<b>'+'TBs queue:'+'</b>'+'<br>')
+            elif newSection == 'served':
+                f.write('<h4>Transport Blocks served at time = '+str(v1)+'</h4>')
+            section = newSection
+        if kind == TTI:
+            prbs = v2
+            f.write('<hr>')
+            f.write('<h3>SUBFRAME NUMBER: '+str(frame)+'</h3>')
+            f.write('<p style="color:blue">'+'Queues status at time = '+str(v1)+'</p>')
+            f.write('UEs Bearers queues:')
+            section = 'queues'
+        elif kind == QUEUE:
+            f.write('<p style="color:blue">%s DRB queue:</p>%s packets %d.. (%d packets, %d bytes)<br>' % (ueName(ue),ueName(ue),id,v1,v2))
+        elif kind == ALLOC:
+            f.write('%s: %s PRBs %s<br>' % (ueName(ue),v1,v2))
+        elif kind == TB_QUEUED:
+            f.write('Sbframe n: %d %s TB %d %s %d bytes %s PRBs<br>' % (frame,ueName(ue),id,TB_TYPES.get(code,'?'),v1,v2))
+        elif kind == TB_SERVED:
+            f.write('<p style="color:green">%s TB %d Served  ---------</p>' % (ueName(ue),id))
+        elif kind == TB_LOST:
+            f.write('<p style="color:red">%s TB %d Lost !!! (%d retransmissions)</p>' % (ueName(ue),id,code))
+        elif kind == PACKET_SERVED:
+            f.write('<p style="color:green"><b>%s Packet %d Served ---------</b></p>' % (ueName(ue),id))
+        elif kind == PACKET_LOST:
+            f.write('<p style="color:red"><b>%s packet %d lost .....%s</b></p>' % (ueName(ue),id,v1))
+    if section == 'queues':
+        f.write('<hr>')
+    elif section == 'alloc':
+        f.write('+++++++++++++++++++++++++++++++++++'+'<br>')
+
+def renderTrace(path, out, tStart=None, tEnd=None, ues=None):
+    """
+        This method renders the [tStart, tEnd) window (in ms) of the trace file path, restricted to the UEs in ues
+        (integer indexes or 'ue<i>' identifiers), to the html file out. It returns the number of rendered records.
+    """
+    header, records = readTrace(path)
+    if ues is not None:
+        ues = [int(ue[2:]) if isinstance(ue, str) and ue.startswith('ue') else int(ue) for ue in ues]
+    records = selectRecords(header, records, tStart, tEnd, ues)
+    with open(out, 'w', buffering=1 << 20) as f:
+        f.write('<h2>'+header['slice']+' '+header['dir']+' scheduler trace</h2>')
+        renderRecords(f, records)
+    return len(records)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Renders a time and UE window of a binary scheduler trace as html.')
+    parser.add_argument('trace', help='scheduler trace file, Logs/<slice><dir>trace.bin')
+    parser.add_argument('--t-start', type=float, default=None, help='window start time in ms')
+    parser.add_argument('--t-end', type=float, default=None, help='window end time in ms')
+    parser.add_argument('--ues', nargs='+', default=None, help='UEs to render (ue<i> or i), all if not set')
+    parser.add_argument('--out', default=None, help='html output file, the trace file with .html extension by default')
+    args = parser.parse_args()
+
+    out = args.out if args.out is not None else args.trace.rsplit('.', 1)[0] + '.html'
+    n = renderTrace(args.trace, out, args.t_start, args.t_end, args.ues)
+    print('%d records rendered to %s' % (n, out))
@@ -0,0 +1,200 @@
+"""
+    This module contains the UeStateStore class, an array backed store for the per UE scheduler state.
+    An intra slice scheduler with a store keeps the state of its UEs as NumPy columns, one row by UE,
+    so metrics of all the UEs can be computed with vector operations and the state can be copied at once.
+    UeBase attributes in STATE_COLUMNS are properties which read and write the UE row of the store,
+    or the UE own dictionary while the UE is not attached to a store.
+"""
+import numpy as np
+
+STATE_COLUMNS = {
+    'MCS': (np.int64, 0),
+    'bler': (np.float64, 0.0),
+    'tbsz': (np.float64, 1.0),
+    'prbs': (np.int64, 0),
+    'pfFactor': (np.float64, 1.0),
+    'resUse': (np.int64, 0),
+    'TXedTB': (np.int64, 1),
+    'lostTB': (np.int64, 0),
+    'assigned_layers': (np.int64, 0)
+}
+"""Dictionary with the (dtype, default value) of each UE state column"""
+
+def stateProperty(name):
+    """This method returns the property of the UE state attribute name, backed by the UE store row if the UE is attached."""
+    def get(ue):
+        store = ue.stateStore
+        if store is None:
+            try:
+                return ue.__dict__[name]
+            except KeyError:
+                raise AttributeError(name)
+        return store.columns[name][ue.stateRow].item()
+    def set(ue, value):
+        store = ue.stateStore
+        if store is None:
+            ue.__dict__[name] = value
+        else:
+            store.columns[name][ue.stateRow] = value
+    return property(get, set)
+
+def pastTbszProperty():
+    """This method returns the property of the UE past TBS window, a deque or a PastTbszRing view if the UE is attached."""
+    def get(ue):
+        store = ue.stateStore
+        if store is None:
+            try:
+                return ue.__dict__['pastTbsz']
+            except KeyError:
+                raise AttributeError('pastTbsz')
+        return PastTbszRing(store, ue.stateRow)
+    def set(ue, value):
+        store = ue.stateStore
+        if store is None:
+            ue.__dict__['pastTbsz'] = value
+        else:
+            store.setPastTbsz(ue.stateRow, value)
+    return property(get, set)
+
+class PastTbszRing:
+    """
+        Deque like view of the past TBS window of a UE in a UeStateStore. It supports len, iteration
+        (oldest value first), append and popleft, as used by PF schedulers.
+    """
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store = store
+        self.row = row
+
+    def __len__(self):
+        return int(self.store.pastLen[self.row])
+
+    def __iter__(self):
+        store = self.store
+        head = int(store.pastHead[self.row])
+        for k in range(int(store.pastLen[self.row])):
+            yield store.pastTbsz[self.row, (head + k) % store.window].item()
+
+    def append(self, value):
+        store = self.store
+        n = int(store.pastLen[self.row])
+        if n == store.window:
+            raise IndexError('past TBS window of '+str(store.window)+' values is full')
+        store.pastTbsz[self.row, (int(store.pastHead[self.row]) + n) % store.window] = value
+        store.pastLen[self.row] = n + 1
+        store.pastSum[self.row] += value
+
+    def popleft(self):
+        store = self.store
+        n = int(store.pastLen[self.row])
+        if n == 0:
+            raise IndexError('pop from an empty past TBS window')
+        head = int(store.pastHead[self.row])
+        value = store.pastTbsz[self.row, head].item()
+        store.pastTbsz[self.row, head] = 0.0 # Positions out of the window hold zeros
+        store.pastHead[self.row] = (head + 1) % store.window
+        store.pastLen[self.row] = n - 1
+        store.pastSum[self.row] -= value
+        return value
+
+class UeStateStore:
+    """
+        Array backed store of the scheduler state of the UEs of a slice direction. Each attached UE gets
+        a dense row index (stateRow) in attach order, and columns grow by doubling their capacity.
+    """
+    def __init__(self, window=31, capacity=16):
+        self.window = window
+        """Maximum length of the past TBS window of each UE"""
+        self.n = 0
+        """Number of attached UEs"""
+        self.ues = []
+        """List of attached UEs, in row order"""
+        self.columns = {}
+        """Dictionary with the array of each column in STATE_COLUMNS"""
+        for name, (dtype, default) in STATE_COLUMNS.items():
+            self.columns[name] = np.full(capacity, default, dtype=dtype)
+        self.pastTbsz = np.zeros((capacity, window))
+        """Ring buffers with the past TBS window of each UE"""
+        self.pastHead = np.zeros(capacity, dtype=np.int64)
+        """Ring buffer index of the oldest past TBS value of each UE"""
+        self.pastLen = np.zeros(capacity, dtype=np.int64)
+        """Number of past TBS values of each UE"""
+        self.pastSum = np.zeros(capacity)
+        """Running sum of the past TBS values of each UE"""
+
+    def capacity(self):
+        return len(self.pastLen)
+
+    def grow(self):
+        """This method doubles the capacity of the columns, filling new rows with the column defaults."""
+        old = self.capacity()
+        for name, (dtype, default) in STATE_COLUMNS.items():
+            col = np.full(2*old, default, dtype=dtype)
+            col[:old] = self.columns[name]
+            self.columns[name] = col
+        pastTbsz = np.zeros((2*old, self.window))
+        pastTbsz[:old] = self.pastTbsz
+        self.pastTbsz = pastTbsz
+        self.pastHead = np.concatenate((self.pastHead, np.zeros(old, dtype=np.int64)))
+        self.pastLen = np.concatenate((self.pastLen, np.zeros(old, dtype=np.int64)))
+        self.pastSum = np.concatenate((self.pastSum, np.zeros(old)))
+
+    def attach(self, ue):
+        """
+            This method moves the state of ue to a new row of the store. From then on, ue state
+            attributes read and write the store columns.
+        """
+        if self.n == self.capacity():
+            self.grow()
+        row = self.n
+        for name in STATE_COLUMNS:
+            if name in ue.__dict__:
+                self.columns[name][row] = ue.__dict__.pop(name)
+        self.setPastTbsz(row, ue.__dict__.pop('pastTbsz', [1]))
+        ue.stateStore = self
+        ue.stateRow = row
+        self.ues.append(ue)
+        self.n = row + 1
+        return row
+
+    def setPastTbsz(self, row, values):
+        """This method replaces the past TBS window of the UE in row with the values iterable."""
+        values = list(values)
+        if len(values) > self.window:
+            raise IndexError('past TBS window of '+str(self.window)+' values is full')
+        self.pastTbsz[row, :] = 0.0
+        self.pastTbsz[row, :len(values)] = values
+        self.pastHead[row] = 0
+        self.pastLen[row] = len(values)
+        self.pastSum[row] = sum(values)
+
+    def pushPastTbsz(self, rows, values):
+        """
+            This method appends values to the past TBS windows of the UEs in rows (an index array without repeated rows).
+            The oldest value of full windows is dropped first, as a deque with popleft and append would do.
+        """
+        heads = self.pastHead[rows]
+        lens = self.pastLen[rows]
+        full = lens == self.window
+        pos = (heads + lens) % self.window # Oldest value position for full windows
+        self.pastSum[rows] += values - self.pastTbsz[rows, pos]
+        self.pastTbsz[rows, pos] = values
+        self.pastHead[rows] = (heads + full) % self.window
+        self.pastLen[rows] = lens + ~full
+
+    def pastMean(self):
+        """This method returns the mean of the past TBS window of each attached UE."""
+        return self.pastSum[:self.n]/self.pastLen[:self.n]
+
+    def column(self, name):
+        """This method returns a view of the column name restricted to the attached UEs rows."""
+        return self.columns[name][:self.n]
+
+    def snapshot(self):
+        """This method returns a dictionary with a copy of every column, restricted to the attached UEs rows."""
+        snap = {}
+        for name in STATE_COLUMNS:
+            snap[name] = self.columns[name][:self.n].copy()
+        snap['pastLen'] = self.pastLen[:self.n].copy()
+        return snap
@@ -1,6 +1,8 @@
 """
     This module contains auxiliary functions and classes.
 """
+import math
+import weakref
 
 def initialSinrGenerator(n_ues, refValue):
     """
@@ -19,6 +21,77 @@ def initialSinrGenerator(n_ues, refValue):
     return genSINRs
 
 
+def timeToNextMultiple(now, interv):
+    """
+        Auxiliary method for periodic PEMs. This method returns the time from now to the next multiple of interv.
+        The sample index is rounded before flooring, so that a time just below a multiple due to float errors
+        waits a whole interval instead of a near-zero one.
+    """
+    k = math.floor(round(now/interv, 9)) + 1
+    return k*interv - now
+
+class CommonRandomStream:
+    """
+        Sequence of uniform random numbers shared by several readers, used for common random numbers
+        comparisons. Each reader gets the same sequence, whatever the number of values the other readers use.
+        Values are drawn in blocks from the rng numpy Generator when a reader needs them, and the blocks
+        already used by every reader are dropped, so the stream keeps only the values between its slowest
+        and its fastest readers.
+    """
+    def __init__(self, rng, block=256):
+        self.rng = rng
+        self.block = block
+        self.values = []
+        self.offset = 0
+        """Stream index of the first value in values"""
+        self.readers = weakref.WeakSet()
+        """Readers of the stream. Values before the lowest reader index are not needed anymore"""
+
+    def reader(self):
+        """This method returns a new reader of the stream, starting from its first value."""
+        if self.offset > 0:
+            raise ValueError('a new reader can not start from the first value of a trimmed stream')
+        reader = CommonRandomReader(self)
+        self.readers.add(reader)
+        return reader
+
+    def extend(self):
+        """This method drops the blocks already used by every reader, and draws a new block of values."""
+        used = min([reader.index for reader in self.readers], default=self.offset + len(self.values)) - self.offset
+        drop = (used//self.block)*self.block
+        if drop > 0:
+            del self.values[:drop]
+            self.offset = self.offset + drop
+        self.values.extend(self.rng.random(self.block).tolist())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['readers'] = list(self.readers)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.readers = weakref.WeakSet(state['readers'])
+
+
+class CommonRandomReader:
+    """Reader of a CommonRandomStream. Its random method can replace random.random."""
+    def __init__(self, stream):
+        self.stream = stream
+        self.index = 0
+        """Stream index of the next value"""
+
+    def random(self):
+        stream = self.stream
+        k = self.index - stream.offset
+        if k == len(stream.values):
+            stream.extend()
+            k = self.index - stream.offset
+        value = stream.values[k]
+        self.index = self.index + 1
+        return value
+
+
 class Format:
     CEND      = '\33[0m'
     CBOLD     = '\33[1m'